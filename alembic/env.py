@@ -1,49 +1,143 @@
 """Alembic environment configuration - Async version for SQLAlchemy 2.0 + asyncpg"""
 
 import asyncio
+import logging
+import re
+from collections.abc import MutableMapping
 from logging.config import fileConfig
+from typing import Literal
 
 from alembic import context
-from sqlalchemy import pool
+from sqlalchemy import MetaData, text
 from sqlalchemy.engine import Connection
-from sqlalchemy.ext.asyncio import async_engine_from_config
+from sqlalchemy.ext.asyncio import AsyncEngine, async_engine_from_config
 
 from src.config import get_settings
-from src.models.base import Base
-from src.models.listing import Listing  # noqa: F401
-from src.models.real_trade import RealTrade  # noqa: F401
-from src.models.favorite import Favorite  # noqa: F401
-from src.models.price_change import PriceChange  # noqa: F401
 
 config = context.config
 
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+logger = logging.getLogger("alembic.env")
+
 settings = get_settings()
 config.set_main_option("sqlalchemy.url", settings.database_url)
 
-target_metadata = Base.metadata
+# Populated by _load_target_metadata() for online runs only; offline SQL
+# generation never consults model metadata.
+target_metadata: MetaData | None = None
 
+# Partitions of real_trades are created by the 20261016_partition migration and
+# ensure_real_trades_partition(); they have no model of their own.
+_PARTITION_TABLE_NAME = re.compile(r"real_trades_(y\d+|default)")
+
+
+def _load_target_metadata() -> MetaData:
+    """Import every model module so Base.metadata is fully populated."""
+
+    from src.models.base import Base
+    from src.models.favorite import Favorite  # noqa: F401
+    from src.models.listing import Listing  # noqa: F401
+    from src.models.price_change import PriceChange  # noqa: F401
+    from src.models.real_trade import RealTrade  # noqa: F401
+
+    return Base.metadata
+
+
+def _tenant_schemas() -> list[str]:
+    """Return tenant schemas passed via ``-x tenants=a,b,c``."""
+
+    raw = context.get_x_argument(as_dictionary=True).get("tenants", "")
+    return [schema.strip() for schema in raw.split(",") if schema.strip()]
+
+
+def _is_upgrade_to_head() -> bool:
+    """Return True when the running command targets the current head."""
+
+    try:
+        destination = context.get_revision_argument()
+    except KeyError:
+        return False
+    return destination is not None and destination == context.script.get_current_head()
+
+
+def include_name(
+    name: str | None,
+    type_: Literal[
+        "schema",
+        "table",
+        "column",
+        "index",
+        "unique_constraint",
+        "foreign_key_constraint",
+    ],
+    parent_names: MutableMapping[
+        Literal["schema_name", "table_name", "schema_qualified_table_name"],
+        str | None,
+    ],
+) -> bool:
+    """Keep real_trades partitions out of autogenerate reflection.
+
+    Every other table is still reflected, so tables dropped from the models
+    keep producing drop_table operations.
+    """
+
+    if type_ == "table" and name is not None:
+        return _PARTITION_TABLE_NAME.fullmatch(name) is None
+    return True
+
+
+def _set_search_path(connection: Connection, search_path: str) -> None:
+    """Set the session search_path and commit it outside any migration."""
+
+    connection.execute(
+        text("SELECT set_config('search_path', :search_path, false)"),
+        {"search_path": search_path},
+    )
+    connection.commit()
+
+
+def _configure_and_run(connection: Connection, schema: str | None = None) -> None:
+    """Configure the migration context on connection and run migrations."""
 
-def do_run_migrations(connection: Connection) -> None:
-    """Run migrations in a synchronous context for Alembic."""
     context.configure(
-        connection=connection, target_metadata=target_metadata, compare_type=True
+        connection=connection,
+        target_metadata=target_metadata,
+        compare_type=True,
+        include_name=include_name,
+        version_table_schema=schema,
     )
 
     with context.begin_transaction():
         context.run_migrations()
 
 
+def do_run_migrations(connection: Connection, schema: str | None = None) -> None:
+    """Run migrations in a synchronous context for Alembic."""
+    if schema is None:
+        _configure_and_run(connection)
+        return
+
+    # Raw SQL in migrations is resolved through search_path; SQLAlchemy
+    # constructs are routed by schema_translate_map. The pooled connection
+    # gets its original search_path back afterwards.
+    original_search_path = connection.execute(text("SHOW search_path")).scalar_one()
+    quoted = connection.dialect.identifier_preparer.quote_schema(schema)
+    _set_search_path(connection, quoted)
+    try:
+        connection.execution_options(schema_translate_map={None: schema})
+        _configure_and_run(connection, schema)
+    finally:
+        _set_search_path(connection, original_search_path)
+
+
 def run_migrations_offline() -> None:
     """Run migrations in offline mode."""
 
     context.configure(
         url=config.get_main_option("sqlalchemy.url"),
-        target_metadata=target_metadata,
         literal_binds=True,
-        compare_type=True,
         dialect_opts={"paramstyle": "named"},
     )
 
@@ -51,17 +145,80 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _tenant_versions(connection: Connection, schemas: list[str]) -> dict[str, set[str]]:
+    """Read alembic_version for every tenant schema in one round trip.
+
+    Schemas without an alembic_version table are absent from the result.
+    """
+
+    versioned = connection.execute(
+        text(
+            "SELECT n.nspname FROM pg_class c "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE c.relname = 'alembic_version' AND n.nspname = ANY(:schemas)"
+        ),
+        {"schemas": schemas},
+    ).scalars()
+    quote_schema = connection.dialect.identifier_preparer.quote_schema
+    params = {f"schema_{index}": schema for index, schema in enumerate(versioned)}
+    if not params:
+        return {}
+
+    union = " UNION ALL ".join(
+        f"SELECT CAST(:{key} AS text) AS schema_name, version_num "
+        f"FROM {quote_schema(schema)}.alembic_version"
+        for key, schema in params.items()
+    )
+    versions: dict[str, set[str]] = {}
+    for schema, version_num in connection.execute(text(union), params):
+        versions.setdefault(schema, set()).add(version_num)
+    return versions
+
+
+async def _pending_schemas(connectable: AsyncEngine, schemas: list[str]) -> list[str]:
+    """Return tenant schemas that still need to run migrations.
+
+    Schemas are only skipped for ``upgrade head``; any other command runs
+    against every tenant.
+    """
+
+    if not _is_upgrade_to_head():
+        return schemas
+
+    async with connectable.connect() as connection:
+        versions = await connection.run_sync(_tenant_versions, schemas)
+
+    head = context.script.get_current_head()
+    pending: list[str] = []
+    for schema in schemas:
+        if versions.get(schema) == {head}:
+            logger.info("Skipping tenant %s: already at head %s", schema, head)
+        else:
+            pending.append(schema)
+    return pending
+
+
 async def run_async_migrations() -> None:
     """Run migrations with async engine."""
     connectable = async_engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        pool_pre_ping=True,
     )
 
     try:
-        async with connectable.connect() as connection:
-            await connection.run_sync(do_run_migrations)
+        schemas = _tenant_schemas()
+        if not schemas:
+            async with connectable.connect() as connection:
+                await connection.run_sync(do_run_migrations)
+            return
+
+        # Alembic's migration context is process-global, so DDL is applied
+        # one tenant at a time.
+        for schema in await _pending_schemas(connectable, schemas):
+            logger.info("Running migrations for tenant %s", schema)
+            async with connectable.connect() as connection:
+                await connection.run_sync(do_run_migrations, schema)
     finally:
         await connectable.dispose()
 
@@ -74,4 +231,5 @@ def run_migrations_online() -> None:
 if context.is_offline_mode():
     run_migrations_offline()
 else:
+    target_metadata = _load_target_metadata()
     run_migrations_online()
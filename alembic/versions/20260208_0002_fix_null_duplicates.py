@@ -7,7 +7,7 @@ Create Date: 2026-02-08 00:00:00
 
 from collections.abc import Sequence
 
-from alembic import op
+from alembic import context, op
 
 # revision identifiers, used by Alembic.
 revision: str = "20260208_0002"
@@ -16,28 +16,99 @@ branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
 
-def upgrade() -> None:
-    """Upgrade schema."""
-
-    op.execute("UPDATE real_trades SET dong='' WHERE dong IS NULL")
-    op.execute("UPDATE real_trades SET apt_name='' WHERE apt_name IS NULL")
-    op.execute("UPDATE real_trades SET floor=0 WHERE floor IS NULL")
+# Identity columns used to detect duplicates, with NULLs folded to their
+# post-migration defaults so NULL and '' rows collapse together.
+_IDENTITY_KEY = """
+    region_code, COALESCE(dong, ''), COALESCE(apt_name, ''), area_m2,
+    COALESCE(floor, 0), contract_year, contract_month, contract_day, rent_type
+"""
 
-    op.execute("""
+# Select with ``alembic -x dedup_strategy=distinct_on upgrade ...``; EXPLAIN
+# against realistic row counts to pick one. ``window`` is the default, and
+# ``rebuild`` (see _rebuild_real_trades) rewrites the table instead.
+_DEDUP_STATEMENTS = {
+    "window": f"""
+        WITH ranked AS (
+            SELECT id,
+                   row_number() OVER (
+                       PARTITION BY {_IDENTITY_KEY}
+                       ORDER BY id
+                   ) AS rn
+            FROM real_trades
+        )
+        DELETE FROM real_trades
+        USING ranked
+        WHERE real_trades.id = ranked.id AND ranked.rn > 1
+    """,
+    "distinct_on": f"""
         DELETE FROM real_trades
         WHERE id NOT IN (
-            SELECT MIN(id)
+            SELECT DISTINCT ON ({_IDENTITY_KEY}) id
             FROM real_trades
-            GROUP BY region_code, dong, apt_name, area_m2, floor,
-                     contract_year, contract_month, contract_day, rent_type
+            ORDER BY {_IDENTITY_KEY}, id
         )
+    """,
+}
+
+
+def _rebuild_real_trades() -> None:
+    """Copy deduplicated, NULL-filled rows into a fresh table and swap it in.
+
+    One sequential write replaces the in-place DELETE + UPDATE passes, which
+    pays off on large tables. real_trades has no FK dependents at this point
+    in the chain. The identity constraint is left for upgrade() to recreate.
+    """
+
+    op.execute("CREATE TABLE real_trades_dedup (LIKE real_trades INCLUDING DEFAULTS)")
+    op.execute(f"""
+        INSERT INTO real_trades_dedup
+        SELECT DISTINCT ON ({_IDENTITY_KEY})
+               id, property_type, rent_type, region_code,
+               COALESCE(dong, ''), COALESCE(apt_name, ''), deposit,
+               monthly_rent, area_m2, COALESCE(floor, 0), contract_year,
+               contract_month, contract_day, created_at
+        FROM real_trades
+        ORDER BY {_IDENTITY_KEY}, id
     """)
+    op.execute("ALTER SEQUENCE real_trades_id_seq OWNED BY NONE")
+    op.execute("DROP TABLE real_trades")
+    op.execute("ALTER TABLE real_trades_dedup RENAME TO real_trades")
+    op.execute("ALTER SEQUENCE real_trades_id_seq OWNED BY real_trades.id")
+    op.create_primary_key("pk_real_trades", "real_trades", ["id"])
+    op.create_index("idx_real_trades_region", "real_trades", ["region_code", "dong"])
+    op.create_index(
+        "idx_real_trades_date", "real_trades", ["contract_year", "contract_month"]
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+
+    strategy = context.get_x_argument(as_dictionary=True).get(
+        "dedup_strategy", "window"
+    )
+    if strategy == "rebuild":
+        _rebuild_real_trades()
+    elif strategy in _DEDUP_STATEMENTS:
+        op.execute(_DEDUP_STATEMENTS[strategy])
+        op.execute("""
+            UPDATE real_trades
+            SET dong = COALESCE(dong, ''),
+                apt_name = COALESCE(apt_name, ''),
+                floor = COALESCE(floor, 0)
+            WHERE dong IS NULL OR apt_name IS NULL OR floor IS NULL
+        """)
+        op.drop_constraint("uq_real_trades_identity", "real_trades", type_="unique")
+    else:
+        raise ValueError(
+            f"Unknown dedup_strategy {strategy!r}; "
+            f"expected one of {sorted([*_DEDUP_STATEMENTS, 'rebuild'])}"
+        )
 
     op.alter_column("real_trades", "dong", nullable=False, server_default="")
     op.alter_column("real_trades", "apt_name", nullable=False, server_default="")
     op.alter_column("real_trades", "floor", nullable=False, server_default="0")
 
-    op.drop_constraint("uq_real_trades_identity", "real_trades", type_="unique")
     op.create_unique_constraint(
         "uq_real_trades_identity",
         "real_trades",
@@ -0,0 +1,157 @@
+"""Partition real_trades by contract_year.
+
+One partition is created per year from _FIRST_PARTITION_YEAR through
+_LAST_PARTITION_YEAR, plus one for any stored year outside that range, so the
+result does not depend on the day the migration runs. Later years land in
+real_trades_default until ``SELECT ensure_real_trades_partition(<year>)`` is
+run, which creates that year's partition and moves its rows out of the default.
+
+Revision ID: 20261016_partition
+Revises: 20260213_snapshot
+Create Date: 2026-10-16 00:00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_partition"
+down_revision: str | None = "20260213_snapshot"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# MOLIT publishes real-trade records from 2006 onwards.
+_FIRST_PARTITION_YEAR = 2006
+_LAST_PARTITION_YEAR = 2035
+
+_IDENTITY_COLUMNS = """
+    property_type, region_code, dong, apt_name, area_m2, floor,
+    contract_year, contract_month, contract_day, rent_type, trade_category
+"""
+
+
+def _rename_legacy_table(suffix: str) -> None:
+    """Move real_trades and its named objects aside so the names can be reused."""
+
+    op.execute(f"ALTER TABLE real_trades RENAME TO real_trades_{suffix}")
+    op.execute(
+        f"ALTER TABLE real_trades_{suffix} "
+        f"RENAME CONSTRAINT pk_real_trades TO pk_real_trades_{suffix}"
+    )
+    op.execute(
+        f"ALTER TABLE real_trades_{suffix} "
+        f"RENAME CONSTRAINT uq_real_trades_identity TO uq_real_trades_identity_{suffix}"
+    )
+    op.execute(
+        f"ALTER INDEX idx_real_trades_region RENAME TO idx_real_trades_region_{suffix}"
+    )
+    op.execute(
+        f"ALTER INDEX idx_real_trades_date RENAME TO idx_real_trades_date_{suffix}"
+    )
+
+
+def _create_shared_indexes() -> None:
+    op.execute(
+        f"ALTER TABLE real_trades "
+        f"ADD CONSTRAINT uq_real_trades_identity UNIQUE ({_IDENTITY_COLUMNS})"
+    )
+    op.execute("CREATE INDEX idx_real_trades_region ON real_trades (region_code, dong)")
+    op.execute(
+        "CREATE INDEX idx_real_trades_date ON real_trades (contract_year, contract_month)"
+    )
+
+
+def _move_rows_and_sequence(suffix: str) -> None:
+    """Copy rows from the renamed table and hand the id sequence over."""
+
+    op.execute(f"INSERT INTO real_trades SELECT * FROM real_trades_{suffix}")
+    # The id sequence is owned by the old table; detach it so DROP TABLE keeps it.
+    op.execute("ALTER SEQUENCE real_trades_id_seq OWNED BY NONE")
+    op.execute(f"DROP TABLE real_trades_{suffix}")
+    op.execute("ALTER SEQUENCE real_trades_id_seq OWNED BY real_trades.id")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+
+    _rename_legacy_table("unpartitioned")
+
+    op.execute("""
+        CREATE TABLE real_trades (
+            LIKE real_trades_unpartitioned INCLUDING DEFAULTS
+        ) PARTITION BY RANGE (contract_year)
+    """)
+    # Partitioned tables need the partition key in every unique constraint.
+    op.execute(
+        "ALTER TABLE real_trades "
+        "ADD CONSTRAINT pk_real_trades PRIMARY KEY (id, contract_year)"
+    )
+    _create_shared_indexes()
+
+    op.execute("CREATE TABLE real_trades_default PARTITION OF real_trades DEFAULT")
+    op.execute("""
+        CREATE FUNCTION ensure_real_trades_partition(partition_year integer)
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            -- Resolve every name in the caller's schema so a tenant never
+            -- sees another schema's partition through search_path.
+            target_schema text := current_schema();
+            partition_name text := format('real_trades_y%s', partition_year);
+        BEGIN
+            IF to_regclass(format('%I.%I', target_schema, partition_name)) IS NOT NULL
+            THEN
+                RETURN;
+            END IF;
+            EXECUTE format(
+                'CREATE TABLE %I.%I (LIKE %I.real_trades INCLUDING DEFAULTS)',
+                target_schema, partition_name, target_schema
+            );
+            EXECUTE format(
+                'WITH moved AS ('
+                'DELETE FROM %I.real_trades_default WHERE contract_year = %s '
+                'RETURNING *) INSERT INTO %I.%I SELECT * FROM moved',
+                target_schema, partition_year, target_schema, partition_name
+            );
+            EXECUTE format(
+                'ALTER TABLE %I.real_trades ATTACH PARTITION %I.%I '
+                'FOR VALUES FROM (%s) TO (%s)',
+                target_schema, target_schema, partition_name,
+                partition_year, partition_year + 1
+            );
+        END
+        $$
+    """)
+    op.execute(f"""
+        SELECT ensure_real_trades_partition(partition_year)
+        FROM (
+            SELECT generate_series(
+                {_FIRST_PARTITION_YEAR}, {_LAST_PARTITION_YEAR}
+            ) AS partition_year
+            UNION
+            SELECT DISTINCT contract_year FROM real_trades_unpartitioned
+        ) AS years
+        ORDER BY partition_year
+    """)
+
+    _move_rows_and_sequence("unpartitioned")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+
+    op.execute("DROP FUNCTION ensure_real_trades_partition(integer)")
+    _rename_legacy_table("partitioned")
+
+    op.execute("""
+        CREATE TABLE real_trades (
+            LIKE real_trades_partitioned INCLUDING DEFAULTS
+        )
+    """)
+    op.execute("ALTER TABLE real_trades ADD CONSTRAINT pk_real_trades PRIMARY KEY (id)")
+    _create_shared_indexes()
+
+    # Dropping the partitioned parent also drops every partition.
+    _move_rows_and_sequence("partitioned")
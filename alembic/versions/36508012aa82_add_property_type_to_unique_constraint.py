@@ -21,24 +21,23 @@ depends_on: str | Sequence[str] | None = None
 def upgrade() -> None:
     """Upgrade schema."""
 
-    op.drop_constraint("uq_real_trades_identity", "real_trades", type_="unique")
+    # Build the new unique index without blocking writes, then swap it in as
+    # the constraint so the ACCESS EXCLUSIVE lock is only held for the rename.
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE UNIQUE INDEX CONCURRENTLY uq_real_trades_identity_idx
+            ON real_trades (
+                property_type, region_code, dong, apt_name, area_m2, floor,
+                contract_year, contract_month, contract_day, rent_type
+            )
+        """)
 
-    op.create_unique_constraint(
-        "uq_real_trades_identity",
-        "real_trades",
-        [
-            "property_type",
-            "region_code",
-            "dong",
-            "apt_name",
-            "area_m2",
-            "floor",
-            "contract_year",
-            "contract_month",
-            "contract_day",
-            "rent_type",
-        ],
-    )
+    op.drop_constraint("uq_real_trades_identity", "real_trades", type_="unique")
+    op.execute("""
+        ALTER TABLE real_trades
+        ADD CONSTRAINT uq_real_trades_identity
+        UNIQUE USING INDEX uq_real_trades_identity_idx
+    """)
 
 
 def downgrade() -> None:
@@ -27,27 +27,24 @@ def upgrade() -> None:
         sa.Column("trade_category", sa.String(), nullable=False, server_default="rent"),
     )
 
-    # Drop old unique constraint (without trade_category)
-    op.drop_constraint("uq_real_trades_identity", "real_trades", type_="unique")
+    # Build the new unique index (with trade_category) without blocking writes
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE UNIQUE INDEX CONCURRENTLY uq_real_trades_identity_idx
+            ON real_trades (
+                property_type, region_code, dong, apt_name, area_m2, floor,
+                contract_year, contract_month, contract_day, rent_type,
+                trade_category
+            )
+        """)
 
-    # Create new unique constraint (with trade_category)
-    op.create_unique_constraint(
-        "uq_real_trades_identity",
-        "real_trades",
-        [
-            "property_type",
-            "region_code",
-            "dong",
-            "apt_name",
-            "area_m2",
-            "floor",
-            "contract_year",
-            "contract_month",
-            "contract_day",
-            "rent_type",
-            "trade_category",
-        ],
-    )
+    # Swap the old unique constraint (without trade_category) for the new index
+    op.drop_constraint("uq_real_trades_identity", "real_trades", type_="unique")
+    op.execute("""
+        ALTER TABLE real_trades
+        ADD CONSTRAINT uq_real_trades_identity
+        UNIQUE USING INDEX uq_real_trades_identity_idx
+    """)
 
 
 def downgrade() -> None:
@@ -0,0 +1,177 @@
+"""MCP payload parsing and seed cleanup shared by the MCP check scripts."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Final, cast
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.favorite import Favorite
+from src.models.listing import Listing
+from src.models.price_change import PriceChange
+
+
+@dataclass(frozen=True)
+class SearchCall:
+    count: int
+    cache_hit: object
+    items: list[dict[str, object]]
+    quality_ok: bool
+
+
+def normalize_payload(mapping: dict[object, object]) -> dict[str, object]:
+    # JSON-derived payloads are already str-keyed; only read from here on, so
+    # the mapping is returned as-is instead of copied.
+    if all(type(key) is str for key in mapping):
+        return cast(dict[str, object], mapping)
+    return {str(key): value for key, value in mapping.items()}
+
+
+def _payload_from_tuple(tool_result: tuple[object, ...]) -> dict[str, object]:
+    # Tools with an output schema return (content, structured_content);
+    # take the structured dict directly instead of re-parsing the text.
+    for part in tool_result:
+        if isinstance(part, dict):
+            return normalize_payload(part)
+    for part in tool_result:
+        if isinstance(part, list) and part:
+            first = part[0]
+            maybe_text = getattr(first, "text", None)
+            if isinstance(maybe_text, str):
+                try:
+                    loaded = json.loads(maybe_text)
+                except json.JSONDecodeError as exc:
+                    raise RuntimeError(
+                        f"Failed to parse MCP text payload as JSON: {exc}"
+                    ) from exc
+                if isinstance(loaded, dict):
+                    return normalize_payload(loaded)
+
+    raise RuntimeError("Failed to extract structured MCP payload from call result")
+
+
+# call_tool returns a plain dict or tuple, so dispatch on the exact type.
+_PAYLOAD_EXTRACTORS: Final[dict[type, Callable[[Any], dict[str, object]]]] = {
+    dict: normalize_payload,
+    tuple: _payload_from_tuple,
+}
+
+
+def extract_mcp_payload(tool_result: object) -> dict[str, object]:
+    extractor = _PAYLOAD_EXTRACTORS.get(type(tool_result))
+    if extractor is None:
+        raise RuntimeError("Failed to extract structured MCP payload from call result")
+    return extractor(tool_result)
+
+
+def _extract_count(payload: dict[str, object], items: list[object]) -> int:
+    """Return the payload `count`, falling back to the already-read items."""
+    count_raw = payload.get("count")
+    if isinstance(count_raw, int):
+        return count_raw
+    if isinstance(count_raw, float):
+        return int(count_raw)
+    return len(items)
+
+
+def parse_search_call(
+    payload: dict[str, object],
+    *,
+    seed_dong: str,
+    mcp_limit: int,
+    seed_source: str | None = None,
+) -> SearchCall:
+    """Normalize `items` and run the per-item quality checks in one pass.
+
+    Items must carry a non-blank `source_id` and the seeded `dong`, and also
+    the seeded `source` when `seed_source` is given.
+    """
+    items = payload.get("items")
+    if not isinstance(items, list):
+        raise TypeError("MCP payload has no list `items`")
+
+    normalized_items: list[dict[str, object]] = []
+    quality_ok = len(items) <= mcp_limit
+    for item in items:
+        if not isinstance(item, dict):
+            raise TypeError("MCP payload contains non-dict item")
+        normalized = normalize_payload(item)
+        normalized_items.append(normalized)
+        if quality_ok:
+            source_id = normalized.get("source_id")
+            quality_ok = (
+                isinstance(source_id, str)
+                and source_id != ""
+                and not source_id.isspace()
+                and (seed_source is None or normalized.get("source") == seed_source)
+                and normalized.get("dong") == seed_dong
+            )
+
+    return SearchCall(
+        count=_extract_count(payload, items),
+        cache_hit=payload.get("cache_hit"),
+        items=normalized_items,
+        quality_ok=quality_ok,
+    )
+
+
+async def cleanup_seed_source(
+    session: AsyncSession, seed_source: str
+) -> dict[str, int]:
+    """Delete every listing of `seed_source` with its favorites and price changes."""
+    # Delete children and parent rows in one statement. FK checks run at the
+    # end of the statement, after every data-modifying CTE has completed.
+    deleted_listings = (
+        delete(Listing)
+        .where(Listing.source == seed_source)
+        .returning(Listing.id)
+        .cte("deleted_listings")
+    )
+    deleted_favorites = (
+        delete(Favorite)
+        .where(Favorite.listing_id.in_(select(deleted_listings.c.id)))
+        .returning(Favorite.id)
+        .cte("deleted_favorites")
+    )
+    deleted_price_changes = (
+        delete(PriceChange)
+        .where(PriceChange.listing_id.in_(select(deleted_listings.c.id)))
+        .returning(PriceChange.id)
+        .cte("deleted_price_changes")
+    )
+    counts = (
+        await session.execute(
+            select(
+                select(func.count()).select_from(deleted_listings).scalar_subquery(),
+                select(func.count()).select_from(deleted_favorites).scalar_subquery(),
+                select(func.count())
+                .select_from(deleted_price_changes)
+                .scalar_subquery(),
+            )
+        )
+    ).one()
+    listings_deleted, favorites_deleted, price_changes_deleted = (
+        int(count) for count in counts
+    )
+    await session.commit()
+
+    return {
+        "seed_listing_ids_count": listings_deleted,
+        "favorites_deleted": favorites_deleted,
+        "price_changes_deleted": price_changes_deleted,
+        "listings_deleted": listings_deleted,
+        "remaining_source_count": await count_source_listings(session, seed_source),
+    }
+
+
+async def count_source_listings(session: AsyncSession, source: str) -> int:
+    count = (
+        await session.execute(
+            select(func.count(Listing.id)).where(Listing.source == source)
+        )
+    ).scalar_one_or_none()
+    return int(count or 0)
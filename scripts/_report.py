@@ -0,0 +1,17 @@
+"""JSON report output shared by the e2e and manual check scripts."""
+
+from __future__ import annotations
+
+import json
+import sys
+from collections.abc import Callable
+
+
+def write_report(
+    report: dict[str, object],
+    default: Callable[[object], object] | None = None,
+) -> None:
+    """Encode the report once and hand it to stdout in a single write."""
+    encoded = json.dumps(report, ensure_ascii=False, indent=2, default=default)
+    sys.stdout.buffer.write(encoded.encode("utf-8") + b"\n")
+    sys.stdout.buffer.flush()
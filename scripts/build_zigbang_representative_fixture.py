@@ -15,9 +15,10 @@ Exit codes:
 from __future__ import annotations
 
 import asyncio
-from collections import Counter
+import hashlib
 import json
 import sys
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -47,7 +48,10 @@ REPRESENTATIVE_IDS = [
     9174,  # 익선동, 현대뜨레비앙
     38010,  # 무악동, 경희궁롯데캐슬
 ]
+REPRESENTATIVE_ID_SET = frozenset(REPRESENTATIVE_IDS)
 OUT_PATH = Path("tests/fixtures/zigbang_search_jongro_representative.json")
+CACHE_DIR = Path(".cache/zigbang")
+SEARCH_URL = httpx.URL(f"{BASE_URL}/search", params={"q": REGION_NAME})
 EXPECTED_REPRESENTATIVE_COUNT = 12
 
 
@@ -60,65 +64,172 @@ def validate_representative_ids(
             f"REPRESENTATIVE_IDS length must be {expected_count}, got {len(representative_ids)}"
         )
 
-    duplicate_ids = sorted(
-        item_id for item_id, count in Counter(representative_ids).items() if count > 1
-    )
+    seen: set[int] = set()
+    duplicate_ids: set[int] = set()
+    for item_id in representative_ids:
+        if item_id in seen:
+            duplicate_ids.add(item_id)
+        else:
+            seen.add(item_id)
     if duplicate_ids:
-        raise ValueError(f"REPRESENTATIVE_IDS contains duplicates: {duplicate_ids}")
+        raise ValueError(
+            f"REPRESENTATIVE_IDS contains duplicates: {sorted(duplicate_ids)}"
+        )
+
+
+def _cache_path(url: httpx.URL) -> Path:
+    return CACHE_DIR / f"{hashlib.sha256(str(url).encode('utf-8')).hexdigest()}.json"
+
+
+def _read_cached_response(url: httpx.URL) -> dict | None:
+    """Return the cached {etag, last_modified, payload} entry for url, if any."""
+    try:
+        return json.loads(_cache_path(url).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached_response(
+    url: httpx.URL, response: httpx.Response, payload: dict
+) -> None:
+    """Persist payload with its validators so later runs can revalidate."""
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag is None and last_modified is None:
+        return
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    entry = {"etag": etag, "last_modified": last_modified, "payload": payload}
+    with _cache_path(url).open("w", encoding="utf-8") as cache_file:
+        json.dump(entry, cache_file, ensure_ascii=False)
+
+
+def _conditional_headers(cached: dict | None) -> dict[str, str]:
+    if cached is None:
+        return {}
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+
+def _reduce_batch(
+    batch: list[dict], wanted: frozenset[int]
+) -> tuple[list[dict], set[int]]:
+    """Keep only representative candidates and the IDs seen in one batch."""
+    candidates = [item for item in batch if item.get("id") in wanted]
+    return candidates, {item["id"] for item in batch}
+
 
+async def fetch_all_items(
+    wanted: frozenset[int],
+) -> tuple[list[dict], list[dict], int, set[int]]:
+    """Fetch Zigbang search results, keeping only representative candidates.
 
-async def fetch_all_items() -> tuple[list[dict], list[dict]]:
-    """Fetch all items from Zigbang API and return (items, request_matrix)."""
+    Each response is reduced as soon as it arrives, so only candidate items
+    (in REQUEST_MATRIX order) are held rather than every fetched item.
+
+    Returns (candidate_items, request_matrix, total_items, unique_ids).
+    """
     headers = {
         "User-Agent": "Mozilla/5.0",
         "Referer": "https://zigbang.com/",
         "Accept": "application/json, text/plain, */*",
+        "Accept-Encoding": "gzip, deflate",
     }
-    items = []
+    limits = httpx.Limits(
+        max_connections=len(REQUEST_MATRIX),
+        max_keepalive_connections=len(REQUEST_MATRIX),
+        keepalive_expiry=30.0,
+    )
+    candidate_items: list[dict] = []
     request_rows = []
+    total_items = 0
+    unique_ids: set[int] = set()
 
-    async with httpx.AsyncClient(timeout=20.0, headers=headers) as client:
-        for property_type, type_code, rent_type, sales_code in REQUEST_MATRIX:
-            url = (
-                f"{BASE_URL}/search?q={REGION_NAME}"
-                f"&typeCode={type_code}&salesTypeCode={sales_code}"
-            )
-            response = await client.get(url)
+    async def fetch(
+        client: httpx.AsyncClient, type_code: str, sales_code: str
+    ) -> tuple[dict, int, list[dict], set[int]]:
+        url = SEARCH_URL.copy_merge_params(
+            {"typeCode": type_code, "salesTypeCode": sales_code}
+        )
+        # The cache lives on disk; keep its file I/O off the event loop.
+        cached = await asyncio.to_thread(_read_cached_response, url)
+        response = await client.get(url, headers=_conditional_headers(cached))
+        if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+            payload = cached["payload"]
+        else:
             response.raise_for_status()
             payload = response.json()
-            batch = payload.get("items", [])
-            items.extend(batch)
-            request_rows.append(
-                {
-                    "region_name": REGION_NAME,
-                    "property_type": property_type,
-                    "type_code": type_code,
-                    "rent_type": rent_type,
-                    "sales_code": sales_code,
-                    "count": len(batch),
-                    "code": payload.get("code"),
-                    "message": payload.get("message"),
-                }
+            await asyncio.to_thread(_write_cached_response, url, response, payload)
+
+        batch = payload.get("items", [])
+        candidates, batch_ids = _reduce_batch(batch, wanted)
+        status = {"code": payload.get("code"), "message": payload.get("message")}
+        return status, len(batch), candidates, batch_ids
+
+    async with httpx.AsyncClient(
+        timeout=20.0, headers=headers, limits=limits
+    ) as client:
+        results = await asyncio.gather(
+            *(
+                fetch(client, type_code, sales_code)
+                for _, type_code, _, sales_code in REQUEST_MATRIX
             )
+        )
+
+    for (property_type, type_code, rent_type, sales_code), result in zip(
+        REQUEST_MATRIX, results, strict=True
+    ):
+        status, count, candidates, batch_ids = result
+        candidate_items.extend(candidates)
+        total_items += count
+        unique_ids |= batch_ids
+        request_rows.append(
+            {
+                "region_name": REGION_NAME,
+                "property_type": property_type,
+                "type_code": type_code,
+                "rent_type": rent_type,
+                "sales_code": sales_code,
+                "count": count,
+                "code": status["code"],
+                "message": status["message"],
+            }
+        )
 
-    return items, request_rows
+    return candidate_items, request_rows, total_items, unique_ids
 
 
 def extract_representative_items(
-    all_items: list[dict],
+    all_items: Iterable[dict],
     representative_ids: list[int],
+    wanted: frozenset[int],
 ) -> list[dict]:
-    """Extract representative items by ID and preserve representative_ids order."""
+    """Extract representative items by ID and preserve representative_ids order.
+
+    wanted is the precomputed set of representative_ids, e.g.
+    REPRESENTATIVE_ID_SET, so it is not rebuilt per call.
+    """
     item_by_id: dict[int, dict] = {}
 
     for item in all_items:
         item_id = item.get("id")
-        if not isinstance(item_id, int):
-            continue
-        if item_id in representative_ids and item_id not in item_by_id:
+        if isinstance(item_id, int) and item_id in wanted and item_id not in item_by_id:
             item_by_id[item_id] = item
+            if len(item_by_id) == len(wanted):
+                break
+
+    return [
+        item_by_id[item_id] for item_id in representative_ids if item_id in item_by_id
+    ]
+
 
-    return [item_by_id[item_id] for item_id in representative_ids if item_id in item_by_id]
+def _write_fixture(fixture: dict) -> None:
+    with OUT_PATH.open("w", encoding="utf-8") as out_file:
+        json.dump(fixture, out_file, ensure_ascii=False, indent=2)
 
 
 async def main() -> int:
@@ -129,16 +240,18 @@ async def main() -> int:
         return 1
 
     print(f"Fetching items from Zigbang API for {REGION_NAME}...")
-    all_items, request_matrix = await fetch_all_items()
-
-    unique_ids = {item["id"] for item in all_items}
-    print(f"Total items: {len(all_items)}, unique IDs: {len(unique_ids)}")
+    candidate_items, request_matrix, total_items, unique_ids = await fetch_all_items(
+        REPRESENTATIVE_ID_SET
+    )
+    print(f"Total items: {total_items}, unique IDs: {len(unique_ids)}")
 
     print(f"Extracting {len(REPRESENTATIVE_IDS)} representative items...")
-    rep_items = extract_representative_items(all_items, REPRESENTATIVE_IDS)
+    rep_items = extract_representative_items(
+        candidate_items, REPRESENTATIVE_IDS, REPRESENTATIVE_ID_SET
+    )
 
     found_ids = {item["id"] for item in rep_items}
-    missing_ids = set(REPRESENTATIVE_IDS) - found_ids
+    missing_ids = REPRESENTATIVE_ID_SET - found_ids
 
     if missing_ids:
         print(f"ERROR: Missing representative IDs: {sorted(missing_ids)}")
@@ -156,7 +269,7 @@ async def main() -> int:
             "captured_at": datetime.now(UTC).isoformat(),
             "region_name": REGION_NAME,
             "request_matrix": request_matrix,
-            "observed_total_items_raw": len(all_items),
+            "observed_total_items_raw": total_items,
             "observed_unique_ids": len(unique_ids),
             "representative_item_ids": REPRESENTATIVE_IDS,
             "representative_item_count": len(REPRESENTATIVE_IDS),
@@ -164,10 +277,7 @@ async def main() -> int:
         "items": rep_items,
     }
 
-    OUT_PATH.write_text(
-        json.dumps(fixture, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    await asyncio.to_thread(_write_fixture, fixture)
     print(f"Wrote {OUT_PATH} with {len(rep_items)} items")
     return 0
 
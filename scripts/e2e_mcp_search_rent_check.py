@@ -13,31 +13,42 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import sys
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Literal, cast
-from uuid import uuid4
-
-from sqlalchemy import delete, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Final, Literal, cast
 
 # Allow direct execution: `python scripts/e2e_mcp_search_rent_check.py ...`
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from scripts._mcp_checks import (
+    SearchCall,
+    cleanup_seed_source,
+    extract_mcp_payload,
+    parse_search_call,
+)
+from scripts._report import write_report
 from src.db.repositories import ListingUpsert, upsert_listings
 from src.db.session import session_context
 from src.mcp_server.server import mcp
-from src.models.favorite import Favorite
-from src.models.listing import Listing
-from src.models.price_change import PriceChange
 
 
+# Seed values are immutable, so build them once at import time.
+_SEED_APT_AREA_M2: Final = Decimal("84.12")
+_SEED_APT_LATITUDE: Final = Decimal("37.5721000")
+_SEED_APT_LONGITUDE: Final = Decimal("126.9792000")
+_SEED_VILLA_AREA_M2: Final = Decimal("55.70")
+_SEED_VILLA_LATITUDE: Final = Decimal("37.5724000")
+_SEED_VILLA_LONGITUDE: Final = Decimal("126.9789000")
+_SEED_OFFICETEL_AREA_M2: Final = Decimal("42.50")
+_SEED_OFFICETEL_LATITUDE: Final = Decimal("37.5727000")
+_SEED_OFFICETEL_LONGITUDE: Final = Decimal("126.9786000")
+
 CleanupScope = Literal["source_only"]
 
 
@@ -49,10 +60,6 @@ class CliArgs:
     cleanup_scope: CleanupScope
 
 
-def _normalize_payload(mapping: dict[object, object]) -> dict[str, object]:
-    return {str(key): value for key, value in mapping.items()}
-
-
 def _parse_args() -> CliArgs:
     parser = argparse.ArgumentParser(
         description="One-shot seed -> MCP search_rent verification script."
@@ -88,53 +95,6 @@ def _parse_args() -> CliArgs:
     )
 
 
-def _extract_mcp_payload(tool_result: object) -> dict[str, object]:
-    if isinstance(tool_result, dict):
-        return _normalize_payload(tool_result)
-    if isinstance(tool_result, tuple):
-        for part in tool_result:
-            if isinstance(part, dict):
-                return _normalize_payload(part)
-            if isinstance(part, list) and part:
-                first = part[0]
-                maybe_text = getattr(first, "text", None)
-                if isinstance(maybe_text, str):
-                    try:
-                        loaded = json.loads(maybe_text)
-                    except json.JSONDecodeError as exc:
-                        raise RuntimeError(
-                            f"Failed to parse MCP text payload as JSON: {exc}"
-                        ) from exc
-                    if isinstance(loaded, dict):
-                        return _normalize_payload(loaded)
-    raise RuntimeError("Failed to extract structured MCP payload from call result")
-
-
-def _extract_count(payload: dict[str, object]) -> int:
-    count_raw = payload.get("count")
-    if isinstance(count_raw, int):
-        return count_raw
-    if isinstance(count_raw, float):
-        return int(count_raw)
-    items = payload.get("items")
-    if isinstance(items, list):
-        return len(items)
-    return 0
-
-
-def _extract_items(payload: dict[str, object]) -> list[dict[str, object]]:
-    items = payload.get("items")
-    if not isinstance(items, list):
-        raise RuntimeError("MCP payload has no list `items`")
-
-    parsed_items: list[dict[str, object]] = []
-    for raw_item in items:
-        if not isinstance(raw_item, dict):
-            raise RuntimeError("MCP payload contains non-dict item")
-        parsed_items.append(_normalize_payload(raw_item))
-    return parsed_items
-
-
 def _build_seed_rows(
     seed_source: str, seed_dong: str, run_id: str
 ) -> list[ListingUpsert]:
@@ -149,12 +109,12 @@ def _build_seed_rows(
             address=f"서울특별시 종로구 {seed_dong} 1",
             dong=seed_dong,
             detail_address=f"{seed_dong} 101호",
-            area_m2=Decimal("84.12"),
+            area_m2=_SEED_APT_AREA_M2,
             floor=12,
             total_floors=25,
             description="MCP seed apt",
-            latitude=Decimal("37.5721000"),
-            longitude=Decimal("126.9792000"),
+            latitude=_SEED_APT_LATITUDE,
+            longitude=_SEED_APT_LONGITUDE,
         ),
         ListingUpsert(
             source=seed_source,
@@ -166,12 +126,12 @@ def _build_seed_rows(
             address=f"서울특별시 종로구 {seed_dong} 2",
             dong=seed_dong,
             detail_address=f"{seed_dong} 202호",
-            area_m2=Decimal("55.70"),
+            area_m2=_SEED_VILLA_AREA_M2,
             floor=3,
             total_floors=5,
             description="MCP seed villa",
-            latitude=Decimal("37.5724000"),
-            longitude=Decimal("126.9789000"),
+            latitude=_SEED_VILLA_LATITUDE,
+            longitude=_SEED_VILLA_LONGITUDE,
         ),
         ListingUpsert(
             source=seed_source,
@@ -183,75 +143,21 @@ def _build_seed_rows(
             address=f"서울특별시 종로구 {seed_dong} 3",
             dong=seed_dong,
             detail_address=f"{seed_dong} 303호",
-            area_m2=Decimal("42.50"),
+            area_m2=_SEED_OFFICETEL_AREA_M2,
             floor=8,
             total_floors=14,
             description="MCP seed officetel",
-            latitude=Decimal("37.5727000"),
-            longitude=Decimal("126.9786000"),
+            latitude=_SEED_OFFICETEL_LATITUDE,
+            longitude=_SEED_OFFICETEL_LONGITUDE,
         ),
     ]
 
 
-async def _cleanup_seed_source(
-    session: AsyncSession, seed_source: str
-) -> dict[str, int]:
-    listing_ids_result = await session.execute(
-        select(Listing.id).where(Listing.source == seed_source)
-    )
-    listing_ids = list(listing_ids_result.scalars().all())
-
-    favorites_deleted = 0
-    price_changes_deleted = 0
-    if listing_ids:
-        favorites_deleted = (
-            await session.execute(
-                select(func.count(Favorite.id)).where(
-                    Favorite.listing_id.in_(listing_ids)
-                )
-            )
-        ).scalar_one_or_none() or 0
-        price_changes_deleted = (
-            await session.execute(
-                select(func.count(PriceChange.id)).where(
-                    PriceChange.listing_id.in_(listing_ids)
-                )
-            )
-        ).scalar_one_or_none() or 0
-        _ = await session.execute(
-            delete(Favorite).where(Favorite.listing_id.in_(listing_ids))
-        )
-        _ = await session.execute(
-            delete(PriceChange).where(PriceChange.listing_id.in_(listing_ids))
-        )
-
-    listings_deleted_result = await session.execute(
-        delete(Listing).where(Listing.source == seed_source)
-    )
-    listings_deleted = int(listings_deleted_result.rowcount or 0)
-    await session.commit()
-
-    remaining_source_count = (
-        await session.execute(
-            select(func.count(Listing.id)).where(Listing.source == seed_source)
-        )
-    ).scalar_one_or_none() or 0
-
-    return {
-        "seed_listing_ids_count": len(listing_ids),
-        "favorites_deleted": int(favorites_deleted),
-        "price_changes_deleted": int(price_changes_deleted),
-        "listings_deleted": listings_deleted,
-        "remaining_source_count": int(remaining_source_count),
-    }
-
-
-def _summarize_call(payload: dict[str, object]) -> dict[str, object]:
-    list_items = _extract_items(payload)
+def _summarize_call(call: SearchCall) -> dict[str, object]:
     return {
-        "count": _extract_count(payload),
-        "cache_hit": payload.get("cache_hit"),
-        "sample_items": list_items[:5],
+        "count": call.count,
+        "cache_hit": call.cache_hit,
+        "sample_items": call.items[:5],
     }
 
 
@@ -259,20 +165,21 @@ async def _run(args: CliArgs) -> dict[str, object]:
     if args.mcp_limit <= 0:
         raise RuntimeError("--mcp-limit must be greater than 0")
 
-    run_id = f"{datetime.now(UTC).strftime('%Y%m%d%H%M%S')}_{uuid4().hex[:8]}"
+    # One timestamp per run keeps run_id and executed_at in agreement.
+    executed_at = datetime.now(UTC)
+    # The low 32 bits of the nanosecond clock disambiguate runs started in
+    # the same second without drawing from os.urandom for a UUID.
+    run_id = f"{executed_at:%Y%m%d%H%M%S}_{time.time_ns() & 0xFFFFFFFF:08x}"
     seed_dong = f"{args.seed_dong_prefix}_{run_id}"
 
+    seed_rows = _build_seed_rows(args.seed_source, seed_dong, run_id)
     async with session_context() as session:
-        cleanup_result = await _cleanup_seed_source(session, args.seed_source)
+        cleanup_result = await cleanup_seed_source(session, args.seed_source)
+        upsert_count = await upsert_listings(session, seed_rows)
 
     failures: list[str] = []
     if cleanup_result["remaining_source_count"] != 0:
         failures.append("cleanup_remaining_source_count_nonzero")
-
-    seed_rows = _build_seed_rows(args.seed_source, seed_dong, run_id)
-    async with session_context() as session:
-        upsert_count = await upsert_listings(session, seed_rows)
-
     if upsert_count <= 0:
         failures.append("upsert_count <= 0")
 
@@ -280,41 +187,35 @@ async def _run(args: CliArgs) -> dict[str, object]:
     first_result = await mcp.call_tool("search_rent", query)
     second_result = await mcp.call_tool("search_rent", query)
 
-    first_payload = _extract_mcp_payload(first_result)
-    second_payload = _extract_mcp_payload(second_result)
-
-    first_items = _extract_items(first_payload)
-    second_items = _extract_items(second_payload)
-
-    first_count = _extract_count(first_payload)
-    second_count = _extract_count(second_payload)
-    expected_count = min(len(seed_rows), args.mcp_limit)
-    first_call_count_matches_items = first_count == len(first_items)
-    second_call_count_matches_items = second_count == len(second_items)
-    counts_match = first_count == second_count
-
-    first_call_items_quality_ok = (
-        len(first_items) <= args.mcp_limit
-        and all(str(item.get("source_id", "")).strip() != "" for item in first_items)
-        and all(item.get("dong") == seed_dong for item in first_items)
+    first_call = parse_search_call(
+        extract_mcp_payload(first_result),
+        seed_dong=seed_dong,
+        mcp_limit=args.mcp_limit,
     )
-    second_call_items_quality_ok = (
-        len(second_items) <= args.mcp_limit
-        and all(str(item.get("source_id", "")).strip() != "" for item in second_items)
-        and all(item.get("dong") == seed_dong for item in second_items)
+    second_call = parse_search_call(
+        extract_mcp_payload(second_result),
+        seed_dong=seed_dong,
+        mcp_limit=args.mcp_limit,
     )
 
-    if first_payload.get("cache_hit") is not False:
+    expected_count = min(len(seed_rows), args.mcp_limit)
+    first_call_count_matches_items = first_call.count == len(first_call.items)
+    second_call_count_matches_items = second_call.count == len(second_call.items)
+    counts_match = first_call.count == second_call.count
+    first_call_items_quality_ok = first_call.quality_ok
+    second_call_items_quality_ok = second_call.quality_ok
+
+    if first_call.cache_hit is not False:
         failures.append("first_call_cache_hit != False")
-    if second_payload.get("cache_hit") is not True:
+    if second_call.cache_hit is not True:
         failures.append("second_call_cache_hit != True")
-    if first_count <= 0:
+    if first_call.count <= 0:
         failures.append("mcp_count <= 0")
     if not first_call_count_matches_items:
         failures.append("first_count != len(first_items)")
     if not second_call_count_matches_items:
         failures.append("second_count != len(second_items)")
-    if first_count != expected_count:
+    if first_call.count != expected_count:
         failures.append("first_count != expected_count")
     if not counts_match:
         failures.append("second_count != first_count")
@@ -325,7 +226,7 @@ async def _run(args: CliArgs) -> dict[str, object]:
 
     report: dict[str, object] = {
         "status": "success" if not failures else "failure",
-        "executed_at": datetime.now(UTC).isoformat(),
+        "executed_at": executed_at.isoformat(),
         "run_id": run_id,
         "seed_source": args.seed_source,
         "seed_dong": seed_dong,
@@ -335,8 +236,8 @@ async def _run(args: CliArgs) -> dict[str, object]:
             "tool": "search_rent",
             "query": query,
             "expected_count": expected_count,
-            "first_call": _summarize_call(first_payload),
-            "second_call": _summarize_call(second_payload),
+            "first_call": _summarize_call(first_call),
+            "second_call": _summarize_call(second_call),
             "first_call_count_matches_items": first_call_count_matches_items,
             "second_call_count_matches_items": second_call_count_matches_items,
             "first_call_items_quality_ok": first_call_items_quality_ok,
@@ -349,20 +250,25 @@ async def _run(args: CliArgs) -> dict[str, object]:
     return report
 
 
+async def run(args: CliArgs) -> dict[str, object]:
+    """Run the check and return its report without printing it."""
+    return await _run(args)
+
+
 async def _async_main() -> int:
     args = _parse_args()
     try:
         report = await _run(args)
     except Exception as exc:  # noqa: BLE001
-        error_report = {
+        error_report: dict[str, object] = {
             "status": "failure",
             "executed_at": datetime.now(UTC).isoformat(),
             "error": str(exc),
         }
-        print(json.dumps(error_report, ensure_ascii=False, indent=2))
+        write_report(error_report)
         return 1
 
-    print(json.dumps(report, ensure_ascii=False, indent=2))
+    write_report(report)
     return 0 if report.get("status") == "success" else 1
 
 
@@ -0,0 +1,119 @@
+"""Run the source-seeded MCP e2e checks concurrently.
+
+`e2e_mcp_search_rent_check` and `e2e_zigbang_mcp_tool_suite` each clean up,
+seed and verify their own rows. Given distinct seed sources and dong prefixes
+they share no data, so both runs are gathered in one event loop.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from collections.abc import Awaitable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import cast
+
+# Allow direct execution: `python scripts/e2e_run_all.py ...`
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from scripts import e2e_mcp_search_rent_check as search_rent_check
+from scripts import e2e_zigbang_mcp_tool_suite as tool_suite
+from scripts._report import write_report
+
+
+@dataclass(frozen=True)
+class CliArgs:
+    seed_source_prefix: str
+    mcp_limit: int
+
+
+def _parse_args() -> CliArgs:
+    parser = argparse.ArgumentParser(
+        description="Run the source-seeded MCP e2e checks concurrently."
+    )
+    _ = parser.add_argument(
+        "--seed-source-prefix",
+        default="zigbang_test_seed",
+        help="Prefix for per-check seed sources (default: zigbang_test_seed)",
+    )
+    _ = parser.add_argument(
+        "--mcp-limit",
+        type=int,
+        default=3,
+        help="MCP search_rent limit (default: 3)",
+    )
+    namespace = parser.parse_args()
+    return CliArgs(
+        seed_source_prefix=cast(str, namespace.seed_source_prefix),
+        mcp_limit=cast(int, namespace.mcp_limit),
+    )
+
+
+def _build_runs(args: CliArgs) -> dict[str, Awaitable[dict[str, object]]]:
+    # Each check deletes every row of its seed source during cleanup, so the
+    # sources must differ for the runs to overlap safely.
+    return {
+        "search_rent_check": search_rent_check.run(
+            search_rent_check.CliArgs(
+                seed_source=f"{args.seed_source_prefix}_search_rent",
+                seed_dong_prefix="MCP_TEST",
+                mcp_limit=args.mcp_limit,
+                cleanup_scope="source_only",
+            )
+        ),
+        "tool_suite": tool_suite.run(
+            tool_suite.CliArgs(
+                seed_source=f"{args.seed_source_prefix}_tool_suite",
+                seed_dong_prefix="ZIGBANG_MCP_TEST",
+                user_id_prefix="zigbang_mcp_suite",
+                mcp_limit=args.mcp_limit,
+                cleanup_scope="source_only",
+            )
+        ),
+    }
+
+
+async def run_all(args: CliArgs) -> dict[str, object]:
+    executed_at = datetime.now(UTC).isoformat()
+    runs = _build_runs(args)
+    results = await asyncio.gather(*runs.values(), return_exceptions=True)
+
+    reports: dict[str, object] = {}
+    for name, result in zip(runs, results, strict=True):
+        if isinstance(result, BaseException):
+            reports[name] = {"status": "failure", "error": str(result)}
+        else:
+            reports[name] = result
+
+    failed = [
+        name
+        for name, report in reports.items()
+        if cast(dict[str, object], report).get("status") != "success"
+    ]
+    summary: dict[str, object] = {
+        "status": "success" if not failed else "failure",
+        "executed_at": executed_at,
+        "reports": reports,
+    }
+    if failed:
+        summary["failed_checks"] = failed
+    return summary
+
+
+async def _async_main() -> int:
+    summary = await run_all(_parse_args())
+    write_report(summary)
+    return 0 if summary.get("status") == "success" else 1
+
+
+def main() -> None:
+    raise SystemExit(asyncio.run(_async_main()))
+
+
+if __name__ == "__main__":
+    main()
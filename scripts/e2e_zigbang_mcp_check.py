@@ -14,15 +14,15 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import sys
-from dataclasses import asdict
+from collections.abc import Callable
+from dataclasses import fields
 from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Allow direct execution: `python scripts/e2e_zigbang_mcp_check.py ...`
@@ -30,15 +30,42 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from scripts._mcp_checks import extract_mcp_payload
+from scripts._report import write_report
 from src.config.region_codes import is_valid_region_code, region_codes_to_district_names
-from src.crawlers.zigbang import ZigbangCrawler, ZigbangSchemaMismatchError
-from src.db.repositories import upsert_listings
-from src.db.session import session_context
-from src.mcp_server.server import mcp
 from src.models.favorite import Favorite
 from src.models.listing import Listing
 from src.models.price_change import PriceChange
 
+# The MCP server, crawler and DB session modules are imported inside _run so
+# `--help` and argument errors do not pay for loading the whole app.
+if TYPE_CHECKING:
+    from src.crawlers.zigbang import ZigbangCrawler
+
+
+_DEFAULT_PROPERTY_TYPES = ("아파트", "빌라/연립", "오피스텔")
+_DEFAULT_PROPERTY_TYPES_RAW = ",".join(_DEFAULT_PROPERTY_TYPES)
+
+# Built once so every snapshot reuses the same compiled SQL, and asyncpg's
+# per-connection prepared statement cache can skip the re-parse and re-plan.
+# One round trip; both listing counts share a single scan of listings.
+_LISTING_COUNTS = (
+    select(
+        func.count().label("listings_total"),
+        func.count()
+        .filter(Listing.source == "zigbang")
+        .label("zigbang_listings_total"),
+    )
+    .select_from(Listing)
+    .subquery()
+)
+_SNAPSHOT_STMT = select(
+    _LISTING_COUNTS.c.listings_total,
+    select(func.count()).select_from(Favorite).scalar_subquery(),
+    select(func.count()).select_from(PriceChange).scalar_subquery(),
+    _LISTING_COUNTS.c.zigbang_listings_total,
+)
+
 
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -51,7 +78,7 @@ def _parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--property-types",
-        default="아파트,빌라/연립,오피스텔",
+        default=_DEFAULT_PROPERTY_TYPES_RAW,
         help="Comma-separated Zigbang property types (default: 아파트,빌라/연립,오피스텔)",
     )
     parser.add_argument(
@@ -74,59 +101,35 @@ def _parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def _json_safe(value: Any) -> Any:
+def _json_default(value: object) -> object:
+    """Encode the non-JSON leaves (Decimal, datetime) while json.dumps walks."""
     if isinstance(value, Decimal):
         return float(value)
     if isinstance(value, datetime):
         return value.isoformat()
-    if isinstance(value, dict):
-        return {k: _json_safe(v) for k, v in value.items()}
-    if isinstance(value, list):
-        return [_json_safe(v) for v in value]
-    if isinstance(value, tuple):
-        return [_json_safe(v) for v in value]
-    return value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
 
 def _parse_property_types(raw: str) -> list[str]:
+    if raw == _DEFAULT_PROPERTY_TYPES_RAW:
+        return list(_DEFAULT_PROPERTY_TYPES)
     return [part.strip() for part in raw.split(",") if part.strip()]
 
 
 def _extract_crawl_metrics(crawler: ZigbangCrawler) -> dict[str, Any]:
-    metrics = getattr(crawler, "last_run_metrics", {})
-    if not isinstance(metrics, dict):
-        return {
-            "raw_count": 0,
-            "parsed_count": 0,
-            "invalid_count": 0,
-            "schema_keys_sample": [],
-            "source_keys_sample": [],
-        }
-
+    metrics = crawler.last_run_metrics
     return {
-        "raw_count": int(metrics.get("raw_count", 0)),
-        "parsed_count": int(metrics.get("parsed_count", 0)),
-        "invalid_count": int(metrics.get("invalid_count", 0)),
-        "schema_keys_sample": metrics.get("schema_keys_sample", []),
-        "source_keys_sample": metrics.get("source_keys_sample", []),
+        "raw_count": metrics["raw_count"],
+        "parsed_count": metrics["parsed_count"],
+        "invalid_count": metrics["invalid_count"],
+        "schema_keys_sample": metrics["schema_keys_sample"],
+        "source_keys_sample": metrics["source_keys_sample"],
     }
 
 
 async def _collect_snapshot(session: AsyncSession) -> dict[str, int]:
-    listings_total = (
-        await session.execute(select(func.count(Listing.id)))
-    ).scalar_one_or_none() or 0
-    favorites_total = (
-        await session.execute(select(func.count(Favorite.id)))
-    ).scalar_one_or_none() or 0
-    price_changes_total = (
-        await session.execute(select(func.count(PriceChange.id)))
-    ).scalar_one_or_none() or 0
-    zigbang_listings_total = (
-        await session.execute(
-            select(func.count(Listing.id)).where(Listing.source == "zigbang")
-        )
-    ).scalar_one_or_none() or 0
+    row = (await session.execute(_SNAPSHOT_STMT)).one()
+    listings_total, favorites_total, price_changes_total, zigbang_listings_total = row
     return {
         "listings_total": int(listings_total),
         "favorites_total": int(favorites_total),
@@ -136,44 +139,16 @@ async def _collect_snapshot(session: AsyncSession) -> dict[str, int]:
 
 
 async def _reset_all_tables(session: AsyncSession) -> None:
-    # FK-safe order: favorites -> price_changes -> listings
-    await session.execute(delete(Favorite))
-    await session.execute(delete(PriceChange))
-    await session.execute(delete(Listing))
+    # One TRUNCATE empties all three tables without per-row deletes. Listing
+    # every table that references listings keeps CASCADE unnecessary.
+    tables = ", ".join(
+        model.__tablename__ for model in (Favorite, PriceChange, Listing)
+    )
+    await session.execute(text(f"TRUNCATE TABLE {tables}"))
     await session.commit()
 
 
-def _extract_mcp_payload(tool_result: Any) -> tuple[dict[str, Any], str | None]:
-    payload: dict[str, Any] | None = None
-    text_payload: str | None = None
-
-    if isinstance(tool_result, dict):
-        payload = tool_result
-    elif isinstance(tool_result, tuple):
-        for part in tool_result:
-            if isinstance(part, dict):
-                payload = part
-            elif isinstance(part, list) and part:
-                first = part[0]
-                maybe_text = getattr(first, "text", None)
-                if isinstance(maybe_text, str):
-                    text_payload = maybe_text
-
-    if payload is None and text_payload is not None:
-        try:
-            loaded = json.loads(text_payload)
-        except json.JSONDecodeError as exc:
-            raise RuntimeError("Failed to parse MCP text payload as JSON") from exc
-        if isinstance(loaded, dict):
-            payload = loaded
-
-    if payload is None:
-        raise RuntimeError("MCP `search_rent` did not return a structured payload")
-
-    return payload, text_payload
-
-
-def _extract_mcp_count(payload: dict[str, Any]) -> int:
+def _extract_mcp_count(payload: dict[str, object]) -> int:
     count_raw = payload.get("count")
     if isinstance(count_raw, int):
         return count_raw
@@ -186,7 +161,12 @@ def _extract_mcp_count(payload: dict[str, Any]) -> int:
     return 0
 
 
-async def _run(args: argparse.Namespace) -> dict[str, Any]:
+async def _run(args: argparse.Namespace, executed_at: str) -> dict[str, Any]:
+    from src.crawlers.zigbang import ZigbangCrawler, ZigbangSchemaMismatchError
+    from src.db.repositories import ListingUpsert, upsert_listings
+    from src.db.session import session_context
+    from src.mcp_server.server import mcp
+
     if args.confirm_reset != "RESET_ALL":
         raise RuntimeError("Reset blocked: --confirm-reset must be exactly RESET_ALL")
 
@@ -206,28 +186,120 @@ async def _run(args: argparse.Namespace) -> dict[str, Any]:
             f"No district name resolved for region code {args.region_code}"
         )
 
+    # One session serves every phase. Each phase commits before the next, so
+    # no transaction is held open across the crawl.
     async with session_context() as session:
-        initial_snapshot = await _collect_snapshot(session)
-        await _reset_all_tables(session)
-        pre_crawl_snapshot = await _collect_snapshot(session)
 
-    if any(value != 0 for value in pre_crawl_snapshot.values()):
-        raise RuntimeError(
-            f"Reset verification failed; expected all zeros, got {pre_crawl_snapshot}"
+        async def reset_tables() -> tuple[dict[str, int], dict[str, int]]:
+            initial = await _collect_snapshot(session)
+            await _reset_all_tables(session)
+            pre_crawl = await _collect_snapshot(session)
+            await session.commit()
+            return initial, pre_crawl
+
+        crawler = ZigbangCrawler(
+            region_names=region_names,
+            region_codes=[args.region_code],
+            property_types=property_types,
+        )
+        # The crawl only talks to Zigbang, so it runs while the reset is in
+        # flight; nothing is persisted until the reset has been verified.
+        reset_outcome, crawl_outcome = await asyncio.gather(
+            reset_tables(), crawler.run(), return_exceptions=True
         )
+        if isinstance(reset_outcome, BaseException):
+            raise reset_outcome
+        initial_snapshot, pre_crawl_snapshot = reset_outcome
+
+        if any(value != 0 for value in pre_crawl_snapshot.values()):
+            raise RuntimeError(
+                "Reset verification failed; expected all zeros, "
+                f"got {pre_crawl_snapshot}"
+            )
+
+        try:
+            if isinstance(crawl_outcome, BaseException):
+                raise crawl_outcome
+            crawl_result = crawl_outcome
+        except ZigbangSchemaMismatchError as exc:
+            crawl_metrics = _extract_crawl_metrics(crawler)
+            failure_report = {
+                "status": "failure",
+                "executed_at": executed_at,
+                "args": {
+                    "region_code": args.region_code,
+                    "property_types": property_types,
+                    "mcp_limit": args.mcp_limit,
+                    "reset_scope": args.reset_scope,
+                },
+                "resolved_region_names": region_names,
+                "snapshots": {
+                    "initial": initial_snapshot,
+                    "pre_crawl": pre_crawl_snapshot,
+                    "post_crawl": pre_crawl_snapshot,
+                },
+                "crawl": {
+                    "source": "zigbang",
+                    "count": 0,
+                    "errors": [str(exc)],
+                    "sample_rows": [],
+                    **crawl_metrics,
+                },
+                "persistence": {
+                    "upsert_count": 0,
+                },
+                "mcp": {
+                    "tool": "search_rent",
+                    "count": 0,
+                    "sample_items": [],
+                },
+                "failures": ["schema_mismatch"],
+            }
+            return failure_report
 
-    crawler = ZigbangCrawler(
-        region_names=region_names,
-        region_codes=[args.region_code],
-        property_types=property_types,
-    )
-    try:
-        crawl_result = await crawler.run()
-    except ZigbangSchemaMismatchError as exc:
         crawl_metrics = _extract_crawl_metrics(crawler)
-        failure_report = {
-            "status": "failure",
-            "executed_at": datetime.now(UTC).isoformat(),
+
+        # ListingUpsert is flat, so a shallow projection replaces asdict's
+        # deep copy.
+        sample_fields = [field.name for field in fields(ListingUpsert)]
+        sample_rows = [
+            {name: getattr(row, name) for name in sample_fields}
+            for row in crawl_result.rows[:5]
+        ]
+
+        upsert_count = await upsert_listings(session, crawl_result.rows)
+
+        # search_rent opens its own sessions, so the snapshot can overlap
+        # with the MCP call; both only read committed rows.
+        post_snapshot, mcp_tool_result = await asyncio.gather(
+            _collect_snapshot(session),
+            mcp.call_tool("search_rent", {"limit": args.mcp_limit}),
+        )
+        mcp_payload = extract_mcp_payload(mcp_tool_result)
+        mcp_count = _extract_mcp_count(mcp_payload)
+        mcp_items = mcp_payload.get("items")
+        mcp_items_sample = mcp_items[:5] if isinstance(mcp_items, list) else []
+
+        failures: list[str] = []
+        if crawl_result.errors:
+            failures.append("crawl_errors_present")
+        if crawl_result.count <= 0:
+            failures.append("crawl_count <= 0")
+        if upsert_count <= 0:
+            failures.append("upsert_count <= 0")
+        if post_snapshot["listings_total"] <= pre_crawl_snapshot["listings_total"]:
+            failures.append("post_listings_total <= pre_listings_total")
+        if mcp_count <= 0:
+            failures.append("mcp_count <= 0")
+        if any(
+            isinstance(item, dict) and not item.get("source_id")
+            for item in mcp_items_sample
+        ):
+            failures.append("mcp_sample_contains_empty_source_id")
+
+        report = {
+            "status": "success" if not failures else "failure",
+            "executed_at": executed_at,
             "args": {
                 "region_code": args.region_code,
                 "property_types": property_types,
@@ -238,114 +310,62 @@ async def _run(args: argparse.Namespace) -> dict[str, Any]:
             "snapshots": {
                 "initial": initial_snapshot,
                 "pre_crawl": pre_crawl_snapshot,
-                "post_crawl": pre_crawl_snapshot,
+                "post_crawl": post_snapshot,
             },
             "crawl": {
                 "source": "zigbang",
-                "count": 0,
-                "errors": [str(exc)],
-                "sample_rows": [],
+                "count": crawl_result.count,
+                "errors": crawl_result.errors,
+                "sample_rows": sample_rows,
                 **crawl_metrics,
             },
             "persistence": {
-                "upsert_count": 0,
+                "upsert_count": upsert_count,
             },
             "mcp": {
                 "tool": "search_rent",
-                "count": 0,
-                "sample_items": [],
+                "count": mcp_count,
+                "sample_items": mcp_items_sample,
             },
-            "failures": ["schema_mismatch"],
         }
-        return _json_safe(failure_report)
+        if failures:
+            report["failures"] = failures
 
-    crawl_metrics = _extract_crawl_metrics(crawler)
-
-    sample_rows = [_json_safe(asdict(row)) for row in crawl_result.rows[:5]]
-
-    async with session_context() as session:
-        upsert_count = await upsert_listings(session, crawl_result.rows)
-        post_snapshot = await _collect_snapshot(session)
-
-    mcp_tool_result = await mcp.call_tool("search_rent", {"limit": args.mcp_limit})
-    mcp_payload, _mcp_text = _extract_mcp_payload(mcp_tool_result)
-    mcp_count = _extract_mcp_count(mcp_payload)
-    mcp_items = mcp_payload.get("items")
-    mcp_items_sample = _json_safe(mcp_items[:5]) if isinstance(mcp_items, list) else []
-
-    failures: list[str] = []
-    if crawl_result.errors:
-        failures.append("crawl_errors_present")
-    if crawl_result.count <= 0:
-        failures.append("crawl_count <= 0")
-    if upsert_count <= 0:
-        failures.append("upsert_count <= 0")
-    if post_snapshot["listings_total"] <= pre_crawl_snapshot["listings_total"]:
-        failures.append("post_listings_total <= pre_listings_total")
-    if mcp_count <= 0:
-        failures.append("mcp_count <= 0")
-    if any(
-        isinstance(item, dict) and str(item.get("source_id", "")) == ""
-        for item in mcp_items_sample
-    ):
-        failures.append("mcp_sample_contains_empty_source_id")
-
-    report = {
-        "status": "success" if not failures else "failure",
-        "executed_at": datetime.now(UTC).isoformat(),
-        "args": {
-            "region_code": args.region_code,
-            "property_types": property_types,
-            "mcp_limit": args.mcp_limit,
-            "reset_scope": args.reset_scope,
-        },
-        "resolved_region_names": region_names,
-        "snapshots": {
-            "initial": initial_snapshot,
-            "pre_crawl": pre_crawl_snapshot,
-            "post_crawl": post_snapshot,
-        },
-        "crawl": {
-            "source": "zigbang",
-            "count": crawl_result.count,
-            "errors": crawl_result.errors,
-            "sample_rows": sample_rows,
-            **crawl_metrics,
-        },
-        "persistence": {
-            "upsert_count": upsert_count,
-        },
-        "mcp": {
-            "tool": "search_rent",
-            "count": mcp_count,
-            "sample_items": mcp_items_sample,
-        },
-    }
-    if failures:
-        report["failures"] = failures
-
-    return _json_safe(report)
+        return report
 
 
 async def _async_main() -> int:
     args = _parse_args()
+    # Every report from this invocation, success or error, shares one timestamp.
+    executed_at = datetime.now(UTC).isoformat()
     try:
-        report = await _run(args)
+        report = await _run(args, executed_at)
     except Exception as exc:  # noqa: BLE001
-        error_report = {
+        error_report: dict[str, object] = {
             "status": "failure",
-            "executed_at": datetime.now(UTC).isoformat(),
+            "executed_at": executed_at,
             "error": str(exc),
         }
-        print(json.dumps(error_report, ensure_ascii=False, indent=2))
+        write_report(error_report, _json_default)
         return 1
 
-    print(json.dumps(report, ensure_ascii=False, indent=2))
+    write_report(report, _json_default)
     return 0 if report.get("status") == "success" else 1
 
 
 def main() -> None:
-    raise SystemExit(asyncio.run(_async_main()))
+    # uvloop ships with uvicorn[standard] on POSIX; fall back to the stock
+    # loop where it is unavailable.
+    loop_factory: Callable[[], asyncio.AbstractEventLoop] | None
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        raise SystemExit(runner.run(_async_main()))
 
 
 if __name__ == "__main__":
@@ -4,30 +4,40 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import sys
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Literal, cast
-from uuid import uuid4
-
-from sqlalchemy import delete, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Final, Literal, cast
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from scripts._mcp_checks import (
+    SearchCall,
+    cleanup_seed_source,
+    extract_mcp_payload,
+    parse_search_call,
+)
+from scripts._report import write_report
 from src.db.repositories import ListingUpsert, upsert_listings
 from src.db.session import session_context
 from src.mcp_server.server import mcp
-from src.models.favorite import Favorite
-from src.models.listing import Listing
-from src.models.price_change import PriceChange
 
 
+_SEED_APT_AREA_M2: Final = Decimal("84.14")
+_SEED_APT_LATITUDE: Final = Decimal("37.5721100")
+_SEED_APT_LONGITUDE: Final = Decimal("126.9792100")
+_SEED_VILLA_AREA_M2: Final = Decimal("55.50")
+_SEED_VILLA_LATITUDE: Final = Decimal("37.5724200")
+_SEED_VILLA_LONGITUDE: Final = Decimal("126.9789200")
+_SEED_OFFICETEL_AREA_M2: Final = Decimal("42.60")
+_SEED_OFFICETEL_LATITUDE: Final = Decimal("37.5727300")
+_SEED_OFFICETEL_LONGITUDE: Final = Decimal("126.9786300")
+
 CleanupScope = Literal["source_only"]
 
 _REQUIRED_STAGE4_TOOLS: tuple[str, ...] = (
@@ -51,10 +61,6 @@ class CliArgs:
     cleanup_scope: CleanupScope
 
 
-def _normalize_payload(mapping: dict[object, object]) -> dict[str, object]:
-    return {str(key): value for key, value in mapping.items()}
-
-
 def _parse_args() -> CliArgs:
     parser = argparse.ArgumentParser(
         description="One-shot Zigbang seed MCP tool-suite verification script."
@@ -96,56 +102,6 @@ def _parse_args() -> CliArgs:
     )
 
 
-def _extract_mcp_payload(tool_result: object) -> dict[str, object]:
-    if isinstance(tool_result, dict):
-        return _normalize_payload(tool_result)
-
-    if isinstance(tool_result, tuple):
-        for part in tool_result:
-            if isinstance(part, dict):
-                return _normalize_payload(part)
-
-            if isinstance(part, list) and part:
-                first = part[0]
-                maybe_text = getattr(first, "text", None)
-                if isinstance(maybe_text, str):
-                    try:
-                        loaded = json.loads(maybe_text)
-                    except json.JSONDecodeError as exc:
-                        raise RuntimeError(
-                            f"Failed to parse MCP text payload as JSON: {exc}"
-                        ) from exc
-                    if isinstance(loaded, dict):
-                        return _normalize_payload(loaded)
-
-    raise RuntimeError("Failed to extract structured MCP payload from call result")
-
-
-def _extract_count(payload: dict[str, object]) -> int:
-    count_raw = payload.get("count")
-    if isinstance(count_raw, int):
-        return count_raw
-    if isinstance(count_raw, float):
-        return int(count_raw)
-    items = payload.get("items")
-    if isinstance(items, list):
-        return len(items)
-    return 0
-
-
-def _extract_items(payload: dict[str, object]) -> list[dict[str, object]]:
-    items = payload.get("items")
-    if not isinstance(items, list):
-        raise RuntimeError("MCP payload has no list `items`")
-
-    normalized_items: list[dict[str, object]] = []
-    for item in items:
-        if not isinstance(item, dict):
-            raise RuntimeError("MCP payload contains non-dict item")
-        normalized_items.append(_normalize_payload(item))
-    return normalized_items
-
-
 def _extract_listing_ids(items: list[dict[str, object]]) -> list[int]:
     listing_ids: list[int] = []
     for item in items:
@@ -171,12 +127,12 @@ def _build_seed_rows(
             address=f"서울특별시 종로구 {seed_dong} 1",
             dong=seed_dong,
             detail_address=f"{seed_dong} 101호",
-            area_m2=Decimal("84.14"),
+            area_m2=_SEED_APT_AREA_M2,
             floor=11,
             total_floors=22,
             description="Zigbang MCP suite seed apt",
-            latitude=Decimal("37.5721100"),
-            longitude=Decimal("126.9792100"),
+            latitude=_SEED_APT_LATITUDE,
+            longitude=_SEED_APT_LONGITUDE,
         ),
         ListingUpsert(
             source=seed_source,
@@ -188,12 +144,12 @@ def _build_seed_rows(
             address=f"서울특별시 종로구 {seed_dong} 2",
             dong=seed_dong,
             detail_address=f"{seed_dong} 202호",
-            area_m2=Decimal("55.50"),
+            area_m2=_SEED_VILLA_AREA_M2,
             floor=4,
             total_floors=6,
             description="Zigbang MCP suite seed villa",
-            latitude=Decimal("37.5724200"),
-            longitude=Decimal("126.9789200"),
+            latitude=_SEED_VILLA_LATITUDE,
+            longitude=_SEED_VILLA_LONGITUDE,
         ),
         ListingUpsert(
             source=seed_source,
@@ -205,99 +161,30 @@ def _build_seed_rows(
             address=f"서울특별시 종로구 {seed_dong} 3",
             dong=seed_dong,
             detail_address=f"{seed_dong} 303호",
-            area_m2=Decimal("42.60"),
+            area_m2=_SEED_OFFICETEL_AREA_M2,
             floor=9,
             total_floors=15,
             description="Zigbang MCP suite seed officetel",
-            latitude=Decimal("37.5727300"),
-            longitude=Decimal("126.9786300"),
+            latitude=_SEED_OFFICETEL_LATITUDE,
+            longitude=_SEED_OFFICETEL_LONGITUDE,
         ),
     ]
 
 
-async def _cleanup_seed_source(
-    session: AsyncSession,
-    seed_source: str,
-) -> dict[str, int]:
-    listing_ids_result = await session.execute(
-        select(Listing.id).where(Listing.source == seed_source)
-    )
-    listing_ids = list(listing_ids_result.scalars().all())
-
-    favorites_deleted = 0
-    price_changes_deleted = 0
-    if listing_ids:
-        favorites_deleted = (
-            await session.execute(
-                select(func.count(Favorite.id)).where(
-                    Favorite.listing_id.in_(listing_ids)
-                )
-            )
-        ).scalar_one_or_none() or 0
-        price_changes_deleted = (
-            await session.execute(
-                select(func.count(PriceChange.id)).where(
-                    PriceChange.listing_id.in_(listing_ids)
-                )
-            )
-        ).scalar_one_or_none() or 0
-
-        _ = await session.execute(
-            delete(Favorite).where(Favorite.listing_id.in_(listing_ids))
-        )
-        _ = await session.execute(
-            delete(PriceChange).where(PriceChange.listing_id.in_(listing_ids))
-        )
-
-    _ = await session.execute(delete(Listing).where(Listing.source == seed_source))
-    listings_deleted = len(listing_ids)
-    await session.commit()
-
-    remaining_source_count = (
-        await session.execute(
-            select(func.count(Listing.id)).where(Listing.source == seed_source)
-        )
-    ).scalar_one_or_none() or 0
-
-    return {
-        "seed_listing_ids_count": len(listing_ids),
-        "favorites_deleted": int(favorites_deleted),
-        "price_changes_deleted": int(price_changes_deleted),
-        "listings_deleted": listings_deleted,
-        "remaining_source_count": int(remaining_source_count),
-    }
-
-
-def _summarize_search_call(payload: dict[str, object]) -> dict[str, object]:
-    items = _extract_items(payload)
+def _summarize_search_call(call: SearchCall) -> dict[str, object]:
     return {
-        "count": _extract_count(payload),
-        "cache_hit": payload.get("cache_hit"),
-        "sample_items": items[:5],
+        "count": call.count,
+        "cache_hit": call.cache_hit,
+        "sample_items": call.items[:5],
     }
 
 
-def _search_items_quality_ok(
-    *,
-    items: list[dict[str, object]],
-    seed_source: str,
-    seed_dong: str,
-    mcp_limit: int,
-) -> bool:
-    return (
-        len(items) <= mcp_limit
-        and all(str(item.get("source_id", "")).strip() != "" for item in items)
-        and all(item.get("source") == seed_source for item in items)
-        and all(item.get("dong") == seed_dong for item in items)
-    )
-
-
 async def _assert_required_tools_available() -> None:
     registered_tools = await mcp.list_tools()
     available_tool_names = {
-        str(getattr(tool, "name", "")).strip()
+        tool_name
         for tool in registered_tools
-        if str(getattr(tool, "name", "")).strip()
+        if (tool_name := str(getattr(tool, "name", "")).strip())
     }
     missing_tools = [
         tool_name
@@ -319,21 +206,22 @@ async def _run(args: CliArgs) -> dict[str, object]:
 
     await _assert_required_tools_available()
 
-    run_id = f"{datetime.now(UTC).strftime('%Y%m%d%H%M%S')}_{uuid4().hex[:8]}"
+    # One timestamp per run keeps run_id and executed_at in agreement.
+    executed_at = datetime.now(UTC)
+    # The low 32 bits of the nanosecond clock disambiguate runs started in
+    # the same second without drawing from os.urandom for a UUID.
+    run_id = f"{executed_at:%Y%m%d%H%M%S}_{time.time_ns() & 0xFFFFFFFF:08x}"
     seed_dong = f"{args.seed_dong_prefix}_{run_id}"
     user_id = f"{args.user_id_prefix}_{run_id}"
 
+    seed_rows = _build_seed_rows(args.seed_source, seed_dong, run_id)
     async with session_context() as session:
-        cleanup_result = await _cleanup_seed_source(session, args.seed_source)
+        cleanup_result = await cleanup_seed_source(session, args.seed_source)
+        upsert_count = await upsert_listings(session, seed_rows)
 
     failures: list[str] = []
     if cleanup_result["remaining_source_count"] != 0:
         failures.append("cleanup_remaining_source_count_nonzero")
-
-    seed_rows = _build_seed_rows(args.seed_source, seed_dong, run_id)
-    async with session_context() as session:
-        upsert_count = await upsert_listings(session, seed_rows)
-
     if upsert_count <= 0:
         failures.append("upsert_count <= 0")
 
@@ -341,39 +229,31 @@ async def _run(args: CliArgs) -> dict[str, object]:
     first_search_result = await mcp.call_tool("search_rent", search_query)
     second_search_result = await mcp.call_tool("search_rent", search_query)
 
-    first_search_payload = _extract_mcp_payload(first_search_result)
-    second_search_payload = _extract_mcp_payload(second_search_result)
-
-    first_search_items = _extract_items(first_search_payload)
-    second_search_items = _extract_items(second_search_payload)
-    first_search_count = _extract_count(first_search_payload)
-    second_search_count = _extract_count(second_search_payload)
-    expected_search_count = min(len(seed_rows), args.mcp_limit)
-
-    first_count_matches_items = first_search_count == len(first_search_items)
-    second_count_matches_items = second_search_count == len(second_search_items)
-    counts_match = first_search_count == second_search_count
-
-    first_quality_ok = _search_items_quality_ok(
-        items=first_search_items,
+    first_search = parse_search_call(
+        extract_mcp_payload(first_search_result),
         seed_source=args.seed_source,
         seed_dong=seed_dong,
         mcp_limit=args.mcp_limit,
     )
-    second_quality_ok = _search_items_quality_ok(
-        items=second_search_items,
+    second_search = parse_search_call(
+        extract_mcp_payload(second_search_result),
         seed_source=args.seed_source,
         seed_dong=seed_dong,
         mcp_limit=args.mcp_limit,
     )
+    expected_search_count = min(len(seed_rows), args.mcp_limit)
 
-    if first_search_payload.get("cache_hit") is not False:
+    first_count_matches_items = first_search.count == len(first_search.items)
+    second_count_matches_items = second_search.count == len(second_search.items)
+    counts_match = first_search.count == second_search.count
+
+    if first_search.cache_hit is not False:
         failures.append("search_first_cache_hit != False")
-    if second_search_payload.get("cache_hit") is not True:
+    if second_search.cache_hit is not True:
         failures.append("search_second_cache_hit != True")
-    if first_search_count <= 0:
+    if first_search.count <= 0:
         failures.append("search_first_count <= 0")
-    if first_search_count != expected_search_count:
+    if first_search.count != expected_search_count:
         failures.append("search_first_count != expected_search_count")
     if not first_count_matches_items:
         failures.append("search_first_count != len(items)")
@@ -381,26 +261,28 @@ async def _run(args: CliArgs) -> dict[str, object]:
         failures.append("search_second_count != len(items)")
     if not counts_match:
         failures.append("search_first_count != search_second_count")
-    if not first_quality_ok:
+    if not first_search.quality_ok:
         failures.append("search_first_items_quality_failed")
-    if not second_quality_ok:
+    if not second_search.quality_ok:
         failures.append("search_second_items_quality_failed")
 
-    listing_ids = _extract_listing_ids(first_search_items)
+    listing_ids = _extract_listing_ids(first_search.items)
     if len(listing_ids) < 1:
         failures.append("search_listing_ids_count < 1")
 
-    favorite_add_payload: dict[str, object] = {}
-    favorites_list_payload: dict[str, object] = {}
-    not_found_payload: dict[str, object] = {}
-    invalid_action_payload: dict[str, object] = {}
+    not_found_listing_id = 2147483647
+
+    async def favorite_flow() -> tuple[dict[str, object], dict[str, object]]:
+        favorite_add_payload: dict[str, object] = {}
+        favorites_list_payload: dict[str, object] = {}
+        if not listing_ids:
+            return favorite_add_payload, favorites_list_payload
 
-    if listing_ids:
         favorite_add_result = await mcp.call_tool(
             "add_favorite",
             {"user_id": user_id, "listing_id": listing_ids[0]},
         )
-        favorite_add_payload = _extract_mcp_payload(favorite_add_result)
+        favorite_add_payload = extract_mcp_payload(favorite_add_result)
         if favorite_add_payload.get("status") != "added":
             failures.append("favorite_add_status != added")
 
@@ -408,7 +290,7 @@ async def _run(args: CliArgs) -> dict[str, object]:
             "list_favorites",
             {"user_id": user_id, "limit": 10},
         )
-        favorites_list_payload = _extract_mcp_payload(favorites_list_result)
+        favorites_list_payload = extract_mcp_payload(favorites_list_result)
         list_items_raw = favorites_list_payload.get("items")
         list_count = favorites_list_payload.get("count")
         if not isinstance(list_items_raw, list):
@@ -427,24 +309,32 @@ async def _run(args: CliArgs) -> dict[str, object]:
                 failures.append("favorite_first_item_not_dict")
             elif first_item.get("listing_id") != listing_ids[0]:
                 failures.append("favorite_first_listing_id_mismatch")
-
-    invalid_action_result = await mcp.call_tool(
-        "manage_favorites",
-        {"action": "invalid", "user_id": user_id},
+        return favorite_add_payload, favorites_list_payload
+
+    # The contract checks neither read nor write the seeded favorite, so they
+    # run alongside the add -> list flow, which must stay in order. Their
+    # failures are recorded after the gather, in the same order as before.
+    favorite_payloads, invalid_action_result, not_found_result = await asyncio.gather(
+        favorite_flow(),
+        mcp.call_tool(
+            "manage_favorites",
+            {"action": "invalid", "user_id": user_id},
+        ),
+        mcp.call_tool(
+            "add_favorite",
+            {"user_id": user_id, "listing_id": not_found_listing_id},
+        ),
     )
-    invalid_action_payload = _extract_mcp_payload(invalid_action_result)
+    favorite_add_payload, favorites_list_payload = favorite_payloads
+
+    invalid_action_payload = extract_mcp_payload(invalid_action_result)
     if invalid_action_payload.get("success") is not False:
         failures.append("manage_invalid_success != False")
     invalid_action_error = str(invalid_action_payload.get("error", "")).lower()
     if "unknown action" not in invalid_action_error:
         failures.append("manage_invalid_error_message_mismatch")
 
-    not_found_listing_id = 2147483647
-    not_found_result = await mcp.call_tool(
-        "add_favorite",
-        {"user_id": user_id, "listing_id": not_found_listing_id},
-    )
-    not_found_payload = _extract_mcp_payload(not_found_result)
+    not_found_payload = extract_mcp_payload(not_found_result)
     if not_found_payload.get("status") != "not_found":
         failures.append("add_not_found_status != not_found")
     if "not found" not in str(not_found_payload.get("message", "")).lower():
@@ -452,7 +342,7 @@ async def _run(args: CliArgs) -> dict[str, object]:
 
     report: dict[str, object] = {
         "status": "success" if not failures else "failure",
-        "executed_at": datetime.now(UTC).isoformat(),
+        "executed_at": executed_at.isoformat(),
         "run_id": run_id,
         "seed_source": args.seed_source,
         "seed_dong": seed_dong,
@@ -462,8 +352,8 @@ async def _run(args: CliArgs) -> dict[str, object]:
         "flow": {
             "search_query": search_query,
             "search_expected_count": expected_search_count,
-            "search_first_call": _summarize_search_call(first_search_payload),
-            "search_second_call": _summarize_search_call(second_search_payload),
+            "search_first_call": _summarize_search_call(first_search),
+            "search_second_call": _summarize_search_call(second_search),
             "search_listing_ids": listing_ids,
             "favorite_add": favorite_add_payload,
             "favorites_list": favorites_list_payload,
@@ -479,20 +369,25 @@ async def _run(args: CliArgs) -> dict[str, object]:
     return report
 
 
+async def run(args: CliArgs) -> dict[str, object]:
+    """Run the check and return its report without printing it."""
+    return await _run(args)
+
+
 async def _async_main() -> int:
     args = _parse_args()
     try:
         report = await _run(args)
     except Exception as exc:  # noqa: BLE001
-        error_report = {
+        error_report: dict[str, object] = {
             "status": "failure",
             "executed_at": datetime.now(UTC).isoformat(),
             "error": str(exc),
         }
-        print(json.dumps(error_report, ensure_ascii=False, indent=2))
+        write_report(error_report)
         return 1
 
-    print(json.dumps(report, ensure_ascii=False, indent=2))
+    write_report(report)
     return 0 if report.get("status") == "success" else 1
 
 
@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections import defaultdict
+import math
+from operator import itemgetter
 from pathlib import Path
+from typing import Final
 
 import httpx
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -19,6 +21,128 @@ logger = logging.getLogger(__name__)
 
 API_ENDPOINT = "https://apis.data.go.kr/1613000/RegionalCode/getRegionalCode"
 OUTPUT_FILE = Path("src/config/region_codes.py")
+_MAX_CONCURRENT_PAGES = 4
+
+# Field name aliases seen across RegionalCode response formats.
+_CTPRVN_CD_KEYS = ("ctprvnCd", "ctpv_cd", "sido_cd")
+_SGG_CD_KEYS = ("sggCd", "sgg_cd")
+_SGG_NM_KEYS = ("sggNm", "sgg_nm")
+
+# Province (Si/Do) code -> name, looked up once per API item.
+_PROVINCE_MAPPING: Final[dict[str, str]] = {
+    "11": "서울특별시",
+    "26": "부산광역시",
+    "27": "대구광역시",
+    "28": "인천광역시",
+    "29": "광주광역시",
+    "30": "대전광역시",
+    "31": "울산광역시",
+    "36": "세종특별자치시",
+    "41": "경기도",
+    "42": "강원특별자치도",
+    "43": "충청북도",
+    "44": "충청남도",
+    "45": "전북특별자치도",
+    "46": "전라남도",
+    "47": "경상북도",
+    "48": "경상남도",
+    "50": "제주특별자치도",
+}
+
+# Province name -> label of its group comment in RegionCode.
+_PROVINCE_LABELS: Final[dict[str, str]] = {
+    "서울특별시": "Seoul",
+    "부산광역시": "Busan",
+    "대구광역시": "Daegu",
+    "인천광역시": "Incheon",
+    "광주광역시": "Gwangju",
+    "대전광역시": "Daejeon",
+    "울산광역시": "Ulsan",
+    "세종특별자치시": "Sejong",
+    "경기도": "Gyeonggi",
+    "강원특별자치도": "Gangwon",
+    "충청북도": "Chungbuk",
+    "충청남도": "Chungnam",
+    "전북특별자치도": "Jeonbuk",
+    "전라남도": "Jeonnam",
+    "경상북도": "Gyeongbuk",
+    "경상남도": "Gyeongnam",
+    "제주특별자치도": "Jeju",
+}
+
+# Lookup tables and helpers derived from SIDO_SIGUNGU, emitted verbatim after
+# the generated data so regenerating the module keeps them.
+_HELPERS_SOURCE: Final = '''\
+# code -> Si/Gun/Gu name, precomputed so lookups skip splitting full names
+_REGION_CODE_TO_DISTRICT_NAME: dict[str, str] = {
+    code: name for districts in SIDO_SIGUNGU.values() for code, name in districts
+}
+
+
+def is_valid_region_code(region_code: str) -> bool:
+    """Check if a 5-digit region code is valid."""
+    return region_code in REGION_CODE_TO_NAME
+
+
+class RegionCodeParts(TypedDict):
+    """Normalized region-code metadata for query filtering."""
+
+    sido: str
+    sigungu: str
+    aliases: list[str]
+
+
+def region_code_to_parts(region_code: str) -> RegionCodeParts | None:
+    """Convert a region code into canonical sido/sigungu/alias parts."""
+    full_name = REGION_CODE_TO_NAME.get(region_code)
+    if not full_name:
+        return None
+
+    parts = full_name.split(maxsplit=1)
+    if len(parts) != 2:
+        return None
+
+    sido_name, sigungu_name = parts
+    aliases = [sigungu_name]
+
+    if "시" in sigungu_name:
+        short_name = sigungu_name.rsplit("시", maxsplit=1)[-1]
+        if short_name and short_name != sigungu_name:
+            aliases.append(short_name)
+
+    return {
+        "sido": sido_name,
+        "sigungu": sigungu_name,
+        "aliases": aliases,
+    }
+
+
+def region_code_to_sigungu_names(region_code: str) -> list[str]:
+    parts = region_code_to_parts(region_code)
+    if not parts:
+        return []
+    return list(parts["aliases"])
+
+
+def region_codes_to_district_names(codes: list[str]) -> list[str]:
+    """Convert region codes to district names.
+
+    Args:
+        codes: List of 5-digit region codes (e.g., ["11110"])
+
+    Returns:
+        List of district names (e.g., ["종로구"])
+
+    Example:
+        >>> region_codes_to_district_names(["11110"])
+        ["종로구"]
+    """
+    return [
+        _REGION_CODE_TO_DISTRICT_NAME[code]
+        for code in codes
+        if code in _REGION_CODE_TO_DISTRICT_NAME
+    ]
+'''
 
 
 class Settings(BaseSettings):
@@ -49,168 +173,186 @@ async def fetch_page(
     return response.json()
 
 
-async def fetch_all_region_codes(service_key: str) -> list[dict]:
-    all_items = []
-    page_no = 1
-    num_of_rows = 1000
+def _page_items(data: dict, page_no: int) -> tuple[list[dict], int] | None:
+    """Return (items, total_count) for one page, or None if the API errored."""
+    logger.debug("Full API response: %s", data)
 
-    timeout = httpx.Timeout(30.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        while True:
-            logger.info(f"Fetching page {page_no}...")
-            data = await fetch_page(client, service_key, page_no, num_of_rows)
+    error = data.get("Error")
+    if error:
+        logger.error("API returned error: %s", error)
+        return None
 
-            logger.info(f"Full API response: {data}")
+    header = data.get("header", {})
 
-            error = data.get("Error")
-            if error:
-                logger.error(f"API returned error: {error}")
-                break
+    result_code = header.get("resultCode") if header else None
+    result_msg = header.get("resultMsg") if header else None
 
-            header = data.get("header", {})
+    if result_code and result_code != "00":
+        logger.error("API error code %s: %s", result_code, result_msg)
+        return None
 
-            result_code = header.get("resultCode") if header else None
-            result_msg = header.get("resultMsg") if header else None
+    body = data.get("body", {})
+    items = body.get("items", []) if isinstance(body, dict) else []
 
-            if result_code and result_code != "00":
-                logger.error(f"API error code {result_code}: {result_msg}")
-                break
+    total_count = body.get("totalCount", 0) if isinstance(body, dict) else 0
 
-            body = data.get("body", {})
-            items = body.get("items", []) if isinstance(body, dict) else []
+    logger.info("Items on page %d: %d (total: %s)", page_no, len(items), total_count)
+    return items, total_count
 
-            total_count = body.get("totalCount", 0) if isinstance(body, dict) else 0
 
-            logger.info(f"Items on page {page_no}: {len(items)} (total: {total_count})")
+async def fetch_all_region_codes(service_key: str) -> list[dict]:
+    all_items = []
+    num_of_rows = 1000
 
-            if not items:
-                break
+    timeout = httpx.Timeout(30.0)
+    # HTTP/1.1 keep-alive: the few concurrent pages reuse pooled connections,
+    # and http2=True would need the optional h2 package, not a dependency.
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        # Page 1 reports totalCount; the remaining pages are then independent
+        # and fetched concurrently, bounded to stay polite to the API.
+        logger.info("Fetching page 1...")
+        first_page = _page_items(
+            await fetch_page(client, service_key, 1, num_of_rows), 1
+        )
+        if first_page is None:
+            return all_items
 
-            all_items.extend(items)
+        first_items, total_count = first_page
+        page_count = 1
+        if len(first_items) == num_of_rows:
+            page_count = max(1, math.ceil(total_count / num_of_rows))
 
-            total_count = body.get("totalCount", 0)
-            fetched_count = len(all_items)
-            logger.info(
-                f"  Fetched {len(items)} items (total: {fetched_count}/{total_count})"
-            )
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PAGES)
 
-            if fetched_count >= total_count or len(items) < num_of_rows:
-                break
+        async def fetch_bounded(page_no: int) -> dict:
+            async with semaphore:
+                logger.info("Fetching page %d...", page_no)
+                return await fetch_page(client, service_key, page_no, num_of_rows)
 
-            page_no += 1
+        remaining_pages = await asyncio.gather(
+            *(fetch_bounded(page_no) for page_no in range(2, page_count + 1))
+        )
 
-            await asyncio.sleep(0.1)
+    # Pages are consumed in order, stopping at the first error or short page
+    # exactly as the sequential loop did.
+    pages: list[tuple[list[dict], int] | None] = [first_page]
+    pages.extend(
+        _page_items(data, page_no)
+        for page_no, data in enumerate(remaining_pages, start=2)
+    )
+    for page in pages:
+        if page is None:
+            break
+        items, total_count = page
+        if not items:
+            break
+
+        all_items.extend(items)
+
+        fetched_count = len(all_items)
+        logger.info(
+            "  Fetched %d items (total: %d/%s)", len(items), fetched_count, total_count
+        )
+
+        if fetched_count >= total_count or len(items) < num_of_rows:
+            break
 
-    logger.info(f"Total items fetched: {len(all_items)}")
+    logger.info("Total items fetched: %d", len(all_items))
     return all_items
 
 
+def _pick_key(item: dict, aliases: tuple[str, ...]) -> str:
+    """Return the first alias present in item, defaulting to the first one."""
+    return next((key for key in aliases if key in item), aliases[0])
+
+
 def parse_region_data(items: list[dict]) -> dict[str, list[tuple[str, str]]]:
-    sido_dict = defaultdict(list)
+    if not items:
+        return {}
 
+    # A response uses one naming scheme throughout, so resolve the field
+    # aliases from the first item instead of probing each alias per item.
+    first_item = items[0]
+    ctprvn_key = _pick_key(first_item, _CTPRVN_CD_KEYS)
+    sgg_cd_key = _pick_key(first_item, _SGG_CD_KEYS)
+    sgg_nm_key = _pick_key(first_item, _SGG_NM_KEYS)
+
+    sido_dict: dict[str, list[tuple[str, str]]] = {}
     for item in items:
-        ctprvn_cd = item.get("ctprvnCd") or item.get("ctpv_cd") or item.get("sido_cd")
-        sgg_cd = item.get("sggCd") or item.get("sgg_cd")
-        sgg_nm = item.get("sggNm") or item.get("sgg_nm")
+        ctprvn_cd = item.get(ctprvn_key)
+        sgg_cd = item.get(sgg_cd_key)
+        sgg_nm = item.get(sgg_nm_key)
 
         if not ctprvn_cd or not sgg_cd or not sgg_nm:
-            logger.warning(f"Skipping item with missing fields: {item}")
+            logger.warning("Skipping item with missing fields: %s", item)
             continue
 
-        province_name = get_province_name(ctprvn_cd)
+        province_name = _PROVINCE_MAPPING.get(ctprvn_cd)
         if not province_name:
             continue
 
-        sido_dict[province_name].append((sgg_cd, sgg_nm))
-
-    return dict(sido_dict)
-
-
-def get_province_name(code: str) -> str | None:
-    province_mapping = {
-        "11": "서울특별시",
-        "26": "부산광역시",
-        "27": "대구광역시",
-        "28": "인천광역시",
-        "29": "광주광역시",
-        "30": "대전광역시",
-        "31": "울산광역시",
-        "36": "세종특별자치시",
-        "41": "경기도",
-        "42": "강원특별자치도",
-        "43": "충청북도",
-        "44": "충청남도",
-        "45": "전북특별자치도",
-        "46": "전라남도",
-        "47": "경상북도",
-        "48": "경상남도",
-        "50": "제주특별자치도",
-    }
+        sido_dict.setdefault(province_name, []).append((sgg_cd, sgg_nm))
 
-    return province_mapping.get(code)
+    # Sort each province's districts by code once, here, so the generator
+    # can emit them in order without re-sorting.
+    by_code = itemgetter(0)
+    for districts in sido_dict.values():
+        districts.sort(key=by_code)
+    return sido_dict
 
 
 def generate_region_codes_python(sido_dict: dict[str, list[tuple[str, str]]]) -> str:
-    all_codes: list[str] = []
-    for province, districts in sido_dict.items():
-        for code, _ in districts:
-            all_codes.append(f'"{code}"')
-
-    all_codes.sort()
-
-    sido_lines = ["SIDO_SIGUNGU: dict[str, list[tuple[str, str]]] = {"]
-    sorted_provinces = sorted(sido_dict.keys())
-
-    for province in sorted_provinces:
-        sido_lines.append(f'    "{province}": [')
-        districts = sorted(sido_dict[province], key=lambda x: x[0])
-        for code, name in districts:
-            sido_lines.append(f'        ("{code}", "{name}"),')
-        sido_lines.append("    ],")
-
-    sido_lines.append("}")
-
-    reverse_lines = [
-        "# Reverse lookup: code -> full name (Si-Do + Si/Gun/Gu)",
-        "REGION_CODE_TO_NAME: dict[str, str] = {",
-        "    code: f'{sido} {name}'",
-        "    for sido, districts in SIDO_SIGUNGU.items()",
-        "    for code, name in districts",
-        "}",
-    ]
+    # Provinces follow their Si/Do code order, and parse_region_data already
+    # sorted each province's districts by code, so codes come out sorted.
+    provinces = [name for name in _PROVINCE_MAPPING.values() if name in sido_dict]
 
-    helper_lines = [
+    lines = [
+        '"""Korean administrative district codes (LAWD_CD) for MOLIT public API.',
         "",
-        "",
-        "def is_valid_region_code(region_code: str) -> bool:",
-        '    """Check if a 5-digit region code is valid."""',
-        "    return region_code in REGION_CODE_TO_NAME",
-    ]
-
-    sections = [
-        '"""Korean administrative district codes (LAWD_CD) for MOLIT public API.\n'
-        "\n"
-        "This module provides the mapping of 5-digit LAWD_CD codes to Si/Gun/Gu names\n"
-        "across all 17 special cities, metropolitan cities, and provinces in South Korea.\n"
+        "This module provides the mapping of 5-digit LAWD_CD codes to Si/Gun/Gu names",
+        "across all 17 special cities, metropolitan cities, and provinces in South Korea.",
         '"""',
         "",
-        "from typing import Literal",
+        "from typing import Literal, TypedDict",
         "",
         "# Type alias for valid region codes",
         "RegionCode = Literal[",
-        *sorted(all_codes),
-        "]",
-        "",
-        "",
-        "# Si/Do level groupings with Si/Gun/Gu subdivisions",
-        *sido_lines,
-        "",
-        "",
-        *reverse_lines,
-        *helper_lines,
     ]
+    for province in provinces:
+        lines.append(f"    # {_PROVINCE_LABELS[province]}")
+        lines.extend(f'    "{code}",' for code, _ in sido_dict[province])
+    lines.extend(
+        [
+            "]",
+            "",
+            "# Si/Do level groupings with Si/Gun/Gu subdivisions",
+            "SIDO_SIGUNGU: dict[str, list[tuple[str, str]]] = {",
+        ]
+    )
 
-    return "\n".join(sections)
+    for province in provinces:
+        lines.append(f'    "{province}": [')
+        lines.extend(
+            f'        ("{code}", "{name}"),' for code, name in sido_dict[province]
+        )
+        lines.append("    ],")
+
+    lines.extend(
+        [
+            "}",
+            "",
+            "# Reverse lookup: code -> full name (Si-Do + Si/Gun/Gu)",
+            "REGION_CODE_TO_NAME: dict[str, str] = {",
+            '    code: f"{sido} {name}"',
+            "    for sido, districts in SIDO_SIGUNGU.items()",
+            "    for code, name in districts",
+            "}",
+            "",
+            _HELPERS_SOURCE,
+        ]
+    )
+
+    return "\n".join(lines)
 
 
 async def main() -> None:
@@ -219,7 +361,7 @@ async def main() -> None:
     try:
         settings = Settings()
     except Exception as e:
-        logger.error(f"Failed to load settings: {e}")
+        logger.error("Failed to load settings: %s", e)
         return
 
     service_key = settings.public_data_api_key
@@ -240,15 +382,17 @@ async def main() -> None:
 
         python_code = generate_region_codes_python(sido_dict)
         OUTPUT_FILE.write_text(python_code, encoding="utf-8")
-        logger.info(f"Successfully wrote {OUTPUT_FILE}")
+        logger.info("Successfully wrote %s", OUTPUT_FILE)
 
         total_districts = sum(len(districts) for districts in sido_dict.values())
-        logger.info(f"Summary: {len(sido_dict)} provinces, {total_districts} districts")
+        logger.info(
+            "Summary: %d provinces, %d districts", len(sido_dict), total_districts
+        )
 
     except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
+        logger.error("HTTP error: %s - %s", e.response.status_code, e.response.text)
     except Exception as e:
-        logger.error(f"Error: {e}", exc_info=True)
+        logger.error("Error: %s", e, exc_info=True)
 
 
 if __name__ == "__main__":
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import sys
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -15,12 +15,41 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from scripts._mcp_checks import extract_mcp_payload, normalize_payload
+from scripts._report import write_report
 from src.config.region_codes import REGION_CODE_TO_NAME, region_code_to_parts
 from src.mcp_server.server import mcp
 
 _CHECK_REGION_CODES = ("41135", "11680", "11110")
 
 
+def _text_field(item: dict[str, object], key: str) -> str:
+    # Address fields are JSON strings or null; skip str() on the common case.
+    value = item.get(key)
+    return value if isinstance(value, str) else ""
+
+
+def _item_in_bundang(item: dict[str, object]) -> bool:
+    return "분당구" in _text_field(item, "dong")
+
+
+def _item_in_gangnam(item: dict[str, object]) -> bool:
+    return "강남구" in _text_field(item, "address") or item.get("dong") == "강남구"
+
+
+def _item_in_jongno(item: dict[str, object]) -> bool:
+    address = _text_field(item, "address")
+    return "종로구" in address or "종로구" in _text_field(item, "dong")
+
+
+# search_rent(region_code=...) passes when at least one item matches its region.
+_SEARCH_REGION_MATCHERS: dict[str, Callable[[dict[str, object]], bool]] = {
+    "41135": _item_in_bundang,
+    "11680": _item_in_gangnam,
+    "11110": _item_in_jongno,
+}
+
+
 @dataclass(frozen=True)
 class CliArgs:
     limit: int
@@ -40,26 +69,6 @@ def _parse_args() -> CliArgs:
     return CliArgs(limit=cast(int, namespace.limit))
 
 
-def _normalize_payload(mapping: dict[object, object]) -> dict[str, object]:
-    return {str(key): value for key, value in mapping.items()}
-
-
-def _extract_payload(tool_result: object) -> dict[str, object]:
-    if isinstance(tool_result, dict):
-        return _normalize_payload(tool_result)
-    if isinstance(tool_result, tuple):
-        for part in tool_result:
-            if isinstance(part, dict):
-                return _normalize_payload(part)
-            if isinstance(part, list) and part:
-                maybe_text = getattr(part[0], "text", None)
-                if isinstance(maybe_text, str):
-                    loaded = json.loads(maybe_text)
-                    if isinstance(loaded, dict):
-                        return _normalize_payload(loaded)
-    raise RuntimeError("Failed to extract structured MCP payload")
-
-
 def _extract_regions(payload: dict[str, object]) -> list[dict[str, object]]:
     regions_raw = payload.get("regions")
     if not isinstance(regions_raw, list):
@@ -68,7 +77,7 @@ def _extract_regions(payload: dict[str, object]) -> list[dict[str, object]]:
     for item in regions_raw:
         if not isinstance(item, dict):
             raise RuntimeError("MCP list_regions payload includes non-dict item")
-        regions.append(_normalize_payload(item))
+        regions.append(normalize_payload(item))
     return regions
 
 
@@ -80,7 +89,7 @@ def _extract_items(payload: dict[str, object]) -> list[dict[str, object]]:
     for item in items_raw:
         if not isinstance(item, dict):
             raise RuntimeError("MCP search_rent payload includes non-dict item")
-        items.append(_normalize_payload(item))
+        items.append(normalize_payload(item))
     return items
 
 
@@ -94,6 +103,20 @@ async def _preflight_tools() -> None:
         raise RuntimeError(f"Required MCP tools are missing: {joined}")
 
 
+def _apt_items_in_region(
+    items: list[dict[str, object]],
+    in_region: Callable[[dict[str, object]], bool],
+) -> bool:
+    """Return True if every item is an apt and at least one is in the region."""
+    any_in_region = False
+    for item in items:
+        if item.get("property_type") != "apt":
+            return False
+        if not any_in_region:
+            any_in_region = in_region(item)
+    return any_in_region
+
+
 def _make_check(name: str, ok: bool, details: dict[str, object]) -> dict[str, object]:
     return {"name": name, "ok": ok, "details": details}
 
@@ -117,111 +140,57 @@ async def _run(args: CliArgs) -> dict[str, object]:
 
     await _preflight_tools()
 
-    regions_payload = _extract_payload(
-        await mcp.call_tool("list_regions", {"sido": "경기도", "sigungu": "분당구"})
+    # The four tool calls are independent reads, so they run concurrently. A
+    # failing call is reported as a failed check instead of aborting the run.
+    regions_result, *search_results = await asyncio.gather(
+        mcp.call_tool("list_regions", {"sido": "경기도", "sigungu": "분당구"}),
+        *(
+            mcp.call_tool(
+                "search_rent",
+                {"region_code": code, "property_type": "apt", "limit": args.limit},
+            )
+            for code in _CHECK_REGION_CODES
+        ),
+        return_exceptions=True,
     )
-    regions = _extract_regions(regions_payload)
-    regions_ok = (
-        len(regions) > 0
-        and any(region.get("sigungu") == "성남시분당구" for region in regions)
-        and all(region.get("sido") == "경기도" for region in regions)
-        and all("분당구" in str(region.get("sigungu", "")) for region in regions)
-    )
-    checks.append(
-        _make_check(
-            "list_regions(경기도, 분당구)",
-            regions_ok,
-            {
-                "count": len(regions),
-                "sample": regions[:5],
-            },
-        )
-    )
-    if not regions_ok:
-        failures.append("list_regions_partial_match_failed")
-
-    search_41135_payload = _extract_payload(
-        await mcp.call_tool(
-            "search_rent",
-            {"region_code": "41135", "property_type": "apt", "limit": args.limit},
-        )
-    )
-    search_41135_items = _extract_items(search_41135_payload)
-    search_41135_ok = (
-        len(search_41135_items) > 0
-        and all(item.get("property_type") == "apt" for item in search_41135_items)
-        and any("분당구" in str(item.get("dong", "")) for item in search_41135_items)
-    )
-    checks.append(
-        _make_check(
-            "search_rent(region_code=41135, property_type=apt)",
-            search_41135_ok,
-            {
-                "count": len(search_41135_items),
-                "sample": search_41135_items[:5],
-            },
-        )
-    )
-    if not search_41135_ok:
-        failures.append("search_rent_41135_failed")
 
-    search_11680_payload = _extract_payload(
-        await mcp.call_tool(
-            "search_rent",
-            {"region_code": "11680", "property_type": "apt", "limit": args.limit},
-        )
-    )
-    search_11680_items = _extract_items(search_11680_payload)
-    search_11680_ok = (
-        len(search_11680_items) > 0
-        and all(item.get("property_type") == "apt" for item in search_11680_items)
-        and any(
-            "강남구" in str(item.get("address", ""))
-            or str(item.get("dong", "")) == "강남구"
-            for item in search_11680_items
+    regions_details: dict[str, object]
+    if isinstance(regions_result, BaseException):
+        regions_ok = False
+        regions_details = {"error": str(regions_result)}
+    else:
+        regions = _extract_regions(extract_mcp_payload(regions_result))
+        regions_ok = (
+            len(regions) > 0
+            and any(region.get("sigungu") == "성남시분당구" for region in regions)
+            and all(region.get("sido") == "경기도" for region in regions)
+            and all("분당구" in str(region.get("sigungu", "")) for region in regions)
         )
-    )
+        regions_details = {"count": len(regions), "sample": regions[:5]}
     checks.append(
-        _make_check(
-            "search_rent(region_code=11680, property_type=apt)",
-            search_11680_ok,
-            {
-                "count": len(search_11680_items),
-                "sample": search_11680_items[:5],
-            },
-        )
+        _make_check("list_regions(경기도, 분당구)", regions_ok, regions_details)
     )
-    if not search_11680_ok:
-        failures.append("search_rent_11680_failed")
+    if not regions_ok:
+        failures.append("list_regions_partial_match_failed")
 
-    search_11110_payload = _extract_payload(
-        await mcp.call_tool(
-            "search_rent",
-            {"region_code": "11110", "property_type": "apt", "limit": args.limit},
-        )
-    )
-    search_11110_items = _extract_items(search_11110_payload)
-    search_11110_ok = (
-        len(search_11110_items) > 0
-        and all(item.get("property_type") == "apt" for item in search_11110_items)
-        and any(
-            "종로구" in str(item.get("address", ""))
-            or "종로구" in str(item.get("dong", ""))
-            for item in search_11110_items
+    for code, search_result in zip(_CHECK_REGION_CODES, search_results, strict=True):
+        search_details: dict[str, object]
+        if isinstance(search_result, BaseException):
+            search_ok = False
+            search_details = {"error": str(search_result)}
+        else:
+            items = _extract_items(extract_mcp_payload(search_result))
+            search_ok = _apt_items_in_region(items, _SEARCH_REGION_MATCHERS[code])
+            search_details = {"count": len(items), "sample": items[:5]}
+        checks.append(
+            _make_check(
+                f"search_rent(region_code={code}, property_type=apt)",
+                search_ok,
+                search_details,
+            )
         )
-    )
-    checks.append(
-        _make_check(
-            "search_rent(region_code=11110, property_type=apt)",
-            search_11110_ok,
-            {
-                "count": len(search_11110_items),
-                "sample": search_11110_items[:5],
-            },
-        )
-    )
-    if not search_11110_ok:
-        failures.append("search_rent_11110_failed")
+        if not search_ok:
+            failures.append(f"search_rent_{code}_failed")
 
     report: dict[str, object] = {
         "status": "success" if not failures else "failure",
@@ -239,16 +208,16 @@ async def _async_main() -> int:
     try:
         report = await _run(args)
     except Exception as exc:  # noqa: BLE001
-        error_report = {
+        error_report: dict[str, object] = {
             "status": "failure",
             "executed_at": datetime.now(UTC).isoformat(),
             "checks": [],
             "failures": [str(exc)],
         }
-        print(json.dumps(error_report, ensure_ascii=False, indent=2))
+        write_report(error_report)
         return 1
 
-    print(json.dumps(report, ensure_ascii=False, indent=2))
+    write_report(report)
     return 0 if report.get("status") == "success" else 1
 
 
@@ -4,31 +4,51 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import sys
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import cast
-
-from sqlalchemy import delete, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Final, cast
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from scripts._mcp_checks import cleanup_seed_source, count_source_listings
+from scripts._report import write_report
 from src.db.repositories import ListingUpsert, upsert_listings
 from src.db.session import session_context
-from src.models.favorite import Favorite
-from src.models.listing import Listing
-from src.models.price_change import PriceChange
-from src.cache import build_search_cache_key, cache_delete
+from src.cache import build_search_cache_key, cache_delete_many
 
 SEED_SOURCE = "manual_test_seed"
 _CACHE_CLEAR_REGION_CODES = ("41135", "11680", "11110")
 _CACHE_CLEAR_LIMITS = (3, 20, 50)
+# build_search_cache_key is deterministic, so the keys are derived once.
+_CACHE_CLEAR_KEYS: Final[tuple[tuple[str, int, str], ...]] = tuple(
+    (
+        region_code,
+        limit,
+        build_search_cache_key(
+            region_code=region_code,
+            dong=None,
+            property_type="apt",
+            rent_type=None,
+            min_deposit=None,
+            max_deposit=None,
+            min_monthly_rent=None,
+            max_monthly_rent=None,
+            min_area=None,
+            max_area=None,
+            min_floor=None,
+            max_floor=None,
+            source=None,
+            limit=limit,
+        ),
+    )
+    for region_code in _CACHE_CLEAR_REGION_CODES
+    for limit in _CACHE_CLEAR_LIMITS
+)
 
 
 @dataclass(frozen=True)
@@ -66,194 +86,125 @@ def _parse_args() -> CliArgs:
     )
 
 
-def _build_seed_rows() -> list[ListingUpsert]:
-    return [
-        ListingUpsert(
-            source=SEED_SOURCE,
-            source_id="manual-seed-41135-apt-1",
-            property_type="apt",
-            rent_type="jeonse",
-            deposit=65000,
-            monthly_rent=0,
-            address="경기도 성남시분당구 정자동 101",
-            dong="성남시분당구",
-            detail_address="분당구 정자동 101-1001",
-            area_m2=Decimal("84.50"),
-            floor=10,
-            total_floors=20,
-            description="manual region seed 41135",
-            latitude=Decimal("37.3615000"),
-            longitude=Decimal("127.1117000"),
-        ),
-        ListingUpsert(
-            source=SEED_SOURCE,
-            source_id="manual-seed-11680-apt-1",
-            property_type="apt",
-            rent_type="monthly",
-            deposit=30000,
-            monthly_rent=120,
-            address="서울특별시 강남구 역삼동 202",
-            dong="강남구",
-            detail_address="강남구 역삼동 202-1201",
-            area_m2=Decimal("59.70"),
-            floor=12,
-            total_floors=30,
-            description="manual region seed 11680",
-            latitude=Decimal("37.5008000"),
-            longitude=Decimal("127.0365000"),
-        ),
-        ListingUpsert(
-            source=SEED_SOURCE,
-            source_id="manual-seed-11680-apt-2",
-            property_type="apt",
-            rent_type="monthly",
-            deposit=45000,
-            monthly_rent=150,
-            address="서울특별시 강남구 역삼동 404",
-            dong="역삼동",
-            detail_address="강남구 역삼동 404-1902",
-            area_m2=Decimal("74.30"),
-            floor=19,
-            total_floors=25,
-            description="manual region seed 11680 naver-style dong",
-            latitude=Decimal("37.5002000"),
-            longitude=Decimal("127.0371000"),
-        ),
-        ListingUpsert(
-            source=SEED_SOURCE,
-            source_id="manual-seed-11110-apt-1",
-            property_type="apt",
-            rent_type="jeonse",
-            deposit=52000,
-            monthly_rent=0,
-            address="서울특별시 종로구 사직동 303",
-            dong="종로구",
-            detail_address="종로구 사직동 303-801",
-            area_m2=Decimal("74.10"),
-            floor=8,
-            total_floors=15,
-            description="manual region seed 11110",
-            latitude=Decimal("37.5759000"),
-            longitude=Decimal("126.9735000"),
-        ),
-    ]
-
-
-async def _cleanup_source_rows(session: AsyncSession) -> dict[str, int]:
-    listing_ids = list(
-        (await session.execute(select(Listing.id).where(Listing.source == SEED_SOURCE)))
-        .scalars()
-        .all()
-    )
-
-    favorites_deleted = 0
-    price_changes_deleted = 0
-    if listing_ids:
-        favorites_deleted = (
-            await session.execute(
-                select(func.count(Favorite.id)).where(
-                    Favorite.listing_id.in_(listing_ids)
-                )
-            )
-        ).scalar_one_or_none() or 0
-        price_changes_deleted = (
-            await session.execute(
-                select(func.count(PriceChange.id)).where(
-                    PriceChange.listing_id.in_(listing_ids)
-                )
-            )
-        ).scalar_one_or_none() or 0
-        _ = await session.execute(
-            delete(Favorite).where(Favorite.listing_id.in_(listing_ids))
-        )
-        _ = await session.execute(
-            delete(PriceChange).where(PriceChange.listing_id.in_(listing_ids))
-        )
-
-    listings_deleted = (
-        await session.execute(
-            select(func.count(Listing.id)).where(Listing.source == SEED_SOURCE)
-        )
-    ).scalar_one_or_none() or 0
-
-    _ = await session.execute(delete(Listing).where(Listing.source == SEED_SOURCE))
-    await session.commit()
-
-    remaining_source_count = (
-        await session.execute(
-            select(func.count(Listing.id)).where(Listing.source == SEED_SOURCE)
-        )
-    ).scalar_one_or_none() or 0
+# ListingUpsert is frozen, so one module-level tuple of seed rows can be
+# shared by every run instead of rebuilding rows and Decimals.
+_SEED_ROWS: Final[tuple[ListingUpsert, ...]] = (
+    ListingUpsert(
+        source=SEED_SOURCE,
+        source_id="manual-seed-41135-apt-1",
+        property_type="apt",
+        rent_type="jeonse",
+        deposit=65000,
+        monthly_rent=0,
+        address="경기도 성남시분당구 정자동 101",
+        dong="성남시분당구",
+        detail_address="분당구 정자동 101-1001",
+        area_m2=Decimal("84.50"),
+        floor=10,
+        total_floors=20,
+        description="manual region seed 41135",
+        latitude=Decimal("37.3615000"),
+        longitude=Decimal("127.1117000"),
+    ),
+    ListingUpsert(
+        source=SEED_SOURCE,
+        source_id="manual-seed-11680-apt-1",
+        property_type="apt",
+        rent_type="monthly",
+        deposit=30000,
+        monthly_rent=120,
+        address="서울특별시 강남구 역삼동 202",
+        dong="강남구",
+        detail_address="강남구 역삼동 202-1201",
+        area_m2=Decimal("59.70"),
+        floor=12,
+        total_floors=30,
+        description="manual region seed 11680",
+        latitude=Decimal("37.5008000"),
+        longitude=Decimal("127.0365000"),
+    ),
+    ListingUpsert(
+        source=SEED_SOURCE,
+        source_id="manual-seed-11680-apt-2",
+        property_type="apt",
+        rent_type="monthly",
+        deposit=45000,
+        monthly_rent=150,
+        address="서울특별시 강남구 역삼동 404",
+        dong="역삼동",
+        detail_address="강남구 역삼동 404-1902",
+        area_m2=Decimal("74.30"),
+        floor=19,
+        total_floors=25,
+        description="manual region seed 11680 naver-style dong",
+        latitude=Decimal("37.5002000"),
+        longitude=Decimal("127.0371000"),
+    ),
+    ListingUpsert(
+        source=SEED_SOURCE,
+        source_id="manual-seed-11110-apt-1",
+        property_type="apt",
+        rent_type="jeonse",
+        deposit=52000,
+        monthly_rent=0,
+        address="서울특별시 종로구 사직동 303",
+        dong="종로구",
+        detail_address="종로구 사직동 303-801",
+        area_m2=Decimal("74.10"),
+        floor=8,
+        total_floors=15,
+        description="manual region seed 11110",
+        latitude=Decimal("37.5759000"),
+        longitude=Decimal("126.9735000"),
+    ),
+)
 
-    return {
-        "seed_listing_ids_count": len(listing_ids),
-        "favorites_deleted": int(favorites_deleted),
-        "price_changes_deleted": int(price_changes_deleted),
-        "listings_deleted": int(listings_deleted),
-        "remaining_source_count": int(remaining_source_count),
-    }
 
-
-async def _count_seed_rows(session: AsyncSession) -> int:
-    count = (
-        await session.execute(
-            select(func.count(Listing.id)).where(Listing.source == SEED_SOURCE)
-        )
-    ).scalar_one_or_none()
-    return int(count or 0)
+def _build_seed_rows() -> list[ListingUpsert]:
+    return list(_SEED_ROWS)
 
 
 async def _clear_manual_check_cache() -> dict[str, object]:
-    cleared_keys: list[dict[str, object]] = []
-
-    for region_code in _CACHE_CLEAR_REGION_CODES:
-        for limit in _CACHE_CLEAR_LIMITS:
-            cache_key = build_search_cache_key(
-                region_code=region_code,
-                dong=None,
-                property_type="apt",
-                rent_type=None,
-                min_deposit=None,
-                max_deposit=None,
-                min_monthly_rent=None,
-                max_monthly_rent=None,
-                min_area=None,
-                max_area=None,
-                min_floor=None,
-                max_floor=None,
-                source=None,
-                limit=limit,
-            )
-            await cache_delete(cache_key)
-            cleared_keys.append(
-                {"region_code": region_code, "limit": limit, "cache_key": cache_key}
-            )
+    # One DEL for every key instead of one Redis connection and command each.
+    await cache_delete_many([cache_key for _, _, cache_key in _CACHE_CLEAR_KEYS])
 
+    cleared_keys: list[dict[str, object]] = [
+        {"region_code": region_code, "limit": limit, "cache_key": cache_key}
+        for region_code, limit, cache_key in _CACHE_CLEAR_KEYS
+    ]
     return {
         "cleared_key_count": len(cleared_keys),
         "keys": cleared_keys,
     }
 
 
+async def _count_seed_rows() -> int:
+    async with session_context() as session:
+        return await count_source_listings(session, SEED_SOURCE)
+
+
 async def _run(args: CliArgs) -> dict[str, object]:
     failures: list[str] = []
     cleanup: dict[str, int] | None = None
     cache_cleanup: dict[str, object] | None = None
 
-    if args.cleanup_source_only:
-        async with session_context() as session:
-            cleanup = await _cleanup_source_rows(session)
-        if cleanup["remaining_source_count"] != 0:
-            failures.append("cleanup_remaining_source_count_nonzero")
-
     seed_rows = _build_seed_rows()
     async with session_context() as session:
+        if args.cleanup_source_only:
+            cleanup = await cleanup_seed_source(session, SEED_SOURCE)
+            if cleanup["remaining_source_count"] != 0:
+                failures.append("cleanup_remaining_source_count_nonzero")
+
         upsert_count = await upsert_listings(session, seed_rows)
-    async with session_context() as session:
-        observed_seed_row_count = await _count_seed_rows(session)
 
+    # The row count (Postgres) and cache eviction (Redis) are independent, so
+    # they overlap; the count gets its own session to run concurrently.
     if args.clear_cache:
-        cache_cleanup = await _clear_manual_check_cache()
+        observed_seed_row_count, cache_cleanup = await asyncio.gather(
+            _count_seed_rows(), _clear_manual_check_cache()
+        )
+    else:
+        observed_seed_row_count = await _count_seed_rows()
 
     if upsert_count <= 0:
         failures.append("upsert_count <= 0")
@@ -288,15 +239,15 @@ async def _async_main() -> int:
     try:
         report = await _run(args)
     except Exception as exc:  # noqa: BLE001
-        error_report = {
+        error_report: dict[str, object] = {
             "status": "failure",
             "executed_at": datetime.now(UTC).isoformat(),
             "error": str(exc),
         }
-        print(json.dumps(error_report, ensure_ascii=False, indent=2))
+        write_report(error_report)
         return 1
 
-    print(json.dumps(report, ensure_ascii=False, indent=2))
+    write_report(report)
     return 0 if report.get("status") == "success" else 1
 
 
@@ -2,6 +2,7 @@
 
 import hashlib
 import json
+from collections.abc import Sequence
 from typing import Any, cast
 
 from redis.asyncio import Redis
@@ -72,3 +73,15 @@ async def cache_delete(key: str) -> None:
         await client.delete(key)
     finally:
         await client.aclose()
+
+
+async def cache_delete_many(keys: Sequence[str]) -> None:
+    """Delete several keys with a single DEL command."""
+
+    if not keys:
+        return
+    client = Redis.from_url(settings.redis_url, encoding="utf-8")
+    try:
+        await client.delete(*keys)
+    finally:
+        await client.aclose()
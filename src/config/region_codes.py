@@ -696,6 +696,11 @@ REGION_CODE_TO_NAME: dict[str, str] = {
     for code, name in districts
 }
 
+# code -> Si/Gun/Gu name, precomputed so lookups skip splitting full names
+_REGION_CODE_TO_DISTRICT_NAME: dict[str, str] = {
+    code: name for districts in SIDO_SIGUNGU.values() for code, name in districts
+}
+
 
 def is_valid_region_code(region_code: str) -> bool:
     """Check if a 5-digit region code is valid."""
@@ -755,9 +760,8 @@ def region_codes_to_district_names(codes: list[str]) -> list[str]:
         >>> region_codes_to_district_names(["11110"])
         ["종로구"]
     """
-    district_names = []
-    for code in codes:
-        names = region_code_to_sigungu_names(code)
-        if names:
-            district_names.append(names[0])
-    return district_names
+    return [
+        _REGION_CODE_TO_DISTRICT_NAME[code]
+        for code in codes
+        if code in _REGION_CODE_TO_DISTRICT_NAME
+    ]
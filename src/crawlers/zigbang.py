@@ -4,7 +4,7 @@ import asyncio
 import logging
 import random
 from decimal import Decimal, InvalidOperation
-from typing import Final
+from typing import Final, TypedDict
 
 import httpx
 
@@ -41,6 +41,18 @@ class ZigbangSchemaMismatchError(RuntimeError):
     pass
 
 
+class ZigbangRunMetrics(TypedDict):
+    """Counters and key samples recorded by the most recent crawler run."""
+
+    raw_count: int
+    parsed_count: int
+    invalid_count: int
+    retry_count: int
+    cooldown_count: int
+    schema_keys_sample: list[list[str]]
+    source_keys_sample: list[list[str]]
+
+
 def _to_int(value: object | None, default: int = 0) -> int:
     if value is None:
         return default
@@ -210,7 +222,7 @@ class ZigbangCrawler:
             "sec-ch-ua-mobile": "?0",
             "sec-ch-ua-platform": '"macOS"',
         }
-        self.last_run_metrics: dict[str, object] = {
+        self.last_run_metrics: ZigbangRunMetrics = {
             "raw_count": 0,
             "parsed_count": 0,
             "invalid_count": 0,
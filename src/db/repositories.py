@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from typing import cast
 
-from sqlalchemy import and_, delete, func, or_, select, tuple_, update
+import asyncpg
+from sqlalchemy import (
+    and_,
+    column,
+    delete,
+    func,
+    or_,
+    select,
+    table,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import Insert as PgInsert
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import ReturningInsert
 
 from src.config.region_codes import region_code_to_parts
 from src.models.favorite import Favorite
@@ -17,6 +31,12 @@ from src.models.listing import Listing
 from src.models.price_change import PriceChange
 from src.models.real_trade import RealTrade
 
+# asyncpg binds at most 32767 parameters per statement.
+_PG_MAX_BIND_PARAMS = 32767
+# Listing batches at least this large are staged with COPY instead of VALUES.
+_COPY_MIN_ROWS = 100
+_LISTING_STAGE_TABLE = "listings_stage"
+
 
 @dataclass(slots=True)
 class RealTradeUpsert:
@@ -48,7 +68,7 @@ class PriceTrendPoint:
     trade_count: int
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ListingUpsert:
     """Payload used to insert/update rental listing records."""
 
@@ -69,6 +89,9 @@ class ListingUpsert:
     longitude: Decimal | None
 
 
+_LISTING_UPSERT_COLUMNS = tuple(field.name for field in fields(ListingUpsert))
+
+
 @dataclass(slots=True)
 class PriceChangeUpsert:
     """Payload used to insert price change records."""
@@ -518,6 +541,133 @@ async def fetch_sale_trades(
     return list(result.scalars().all())
 
 
+def _listing_upsert_statement(
+    stmt: PgInsert, now: datetime
+) -> ReturningInsert[tuple[int]]:
+    """Attach the listings ON CONFLICT DO UPDATE clause and RETURNING id."""
+
+    return stmt.on_conflict_do_update(
+        constraint="uq_listings_source_source_id",
+        set_={
+            "deposit": stmt.excluded.deposit,
+            "monthly_rent": stmt.excluded.monthly_rent,
+            "address": stmt.excluded.address,
+            "dong": stmt.excluded.dong,
+            "detail_address": stmt.excluded.detail_address,
+            "area_m2": stmt.excluded.area_m2,
+            "floor": stmt.excluded.floor,
+            "total_floors": stmt.excluded.total_floors,
+            "description": stmt.excluded.description,
+            "latitude": stmt.excluded.latitude,
+            "longitude": stmt.excluded.longitude,
+            "last_seen_at": now,
+            "is_active": True,
+        },
+    ).returning(Listing.id)
+
+
+async def _upsert_listings_via_values(
+    session: AsyncSession,
+    rows: list[ListingUpsert],
+    values: list[dict[str, object]],
+    now: datetime,
+) -> tuple[dict[tuple[str, str], tuple[int, int, int]], list[int]]:
+    """Upsert with multi-row VALUES statements; returns (existing, affected ids)."""
+
+    existing_map: dict[tuple[str, str], tuple[int, int, int]] = {}
+    affected_ids: list[int] = []
+    # Each chunk is one multi-row INSERT ... RETURNING round trip, sized to
+    # stay under the Postgres bind parameter limit.
+    batch_size = _PG_MAX_BIND_PARAMS // len(Listing.__table__.columns)
+    for start in range(0, len(rows), batch_size):
+        batch_rows = rows[start : start + batch_size]
+        sources = [(row.source, row.source_id) for row in batch_rows]
+        fetch_stmt = select(
+            Listing.id,
+            Listing.source,
+            Listing.source_id,
+            Listing.deposit,
+            Listing.monthly_rent,
+        ).where(tuple_(Listing.source, Listing.source_id).in_(sources))
+        existing_map.update(
+            ((r.source, r.source_id), (r.id, r.deposit, r.monthly_rent))
+            for r in (await session.execute(fetch_stmt)).all()
+        )
+
+        stmt = _listing_upsert_statement(
+            pg_insert(Listing).values(values[start : start + batch_size]), now
+        )
+        result = await session.execute(stmt)
+        affected_ids.extend(result.scalars().all())
+
+    return existing_map, affected_ids
+
+
+async def _upsert_listings_via_copy(
+    session: AsyncSession,
+    values: list[dict[str, object]],
+    now: datetime,
+) -> tuple[dict[tuple[str, str], tuple[int, int, int]], list[int]]:
+    """COPY rows into a temp staging table, then merge with one upsert.
+
+    Used for large asyncpg batches, where streaming the rows with COPY is
+    cheaper than binding every value into INSERT statements.
+    """
+
+    column_list = ", ".join(_LISTING_UPSERT_COLUMNS)
+    # Built from listings' own columns (no defaults), so ids are not drawn
+    # from listings_id_seq for staged rows; dropped when upsert_listings commits.
+    await session.execute(
+        text(
+            f"CREATE TEMP TABLE {_LISTING_STAGE_TABLE} ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM listings WITH NO DATA"
+        )
+    )
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    # Only reached when the dialect driver is asyncpg.
+    driver_connection = cast(asyncpg.Connection, raw_connection.driver_connection)
+    await driver_connection.copy_records_to_table(
+        _LISTING_STAGE_TABLE,
+        records=[
+            tuple(value[column] for column in _LISTING_UPSERT_COLUMNS)
+            for value in values
+        ],
+        columns=list(_LISTING_UPSERT_COLUMNS),
+    )
+
+    stage = table(
+        _LISTING_STAGE_TABLE, *(column(name) for name in _LISTING_UPSERT_COLUMNS)
+    )
+    fetch_stmt = select(
+        Listing.id,
+        Listing.source,
+        Listing.source_id,
+        Listing.deposit,
+        Listing.monthly_rent,
+    ).join(
+        stage,
+        and_(
+            Listing.source == stage.c.source,
+            Listing.source_id == stage.c.source_id,
+        ),
+    )
+    existing_map = {
+        (r.source, r.source_id): (r.id, r.deposit, r.monthly_rent)
+        for r in (await session.execute(fetch_stmt)).all()
+    }
+
+    stmt = _listing_upsert_statement(
+        pg_insert(Listing).from_select(
+            list(_LISTING_UPSERT_COLUMNS),
+            select(*(stage.c[name] for name in _LISTING_UPSERT_COLUMNS)),
+        ),
+        now,
+    )
+    result = await session.execute(stmt)
+    return existing_map, list(result.scalars().all())
+
+
 async def upsert_listings(session: AsyncSession, rows: list[ListingUpsert]) -> int:
     """Insert or update rental listing rows with ON CONFLICT DO UPDATE."""
 
@@ -536,40 +686,15 @@ async def upsert_listings(session: AsyncSession, rows: list[ListingUpsert]) -> i
     now = datetime.now(UTC)
 
     if dialect_name == "postgresql":
-        sources = [(row.source, row.source_id) for row in rows]
-        fetch_stmt = select(
-            Listing.id,
-            Listing.source,
-            Listing.source_id,
-            Listing.deposit,
-            Listing.monthly_rent,
-        ).where(tuple_(Listing.source, Listing.source_id).in_(sources))
-        existing_map = {
-            (r.source, r.source_id): (r.id, r.deposit, r.monthly_rent)
-            for r in (await session.execute(fetch_stmt)).all()
-        }
-
-        stmt = pg_insert(Listing).values(values)
-        stmt = stmt.on_conflict_do_update(
-            constraint="uq_listings_source_source_id",
-            set_={
-                "deposit": stmt.excluded.deposit,
-                "monthly_rent": stmt.excluded.monthly_rent,
-                "address": stmt.excluded.address,
-                "dong": stmt.excluded.dong,
-                "detail_address": stmt.excluded.detail_address,
-                "area_m2": stmt.excluded.area_m2,
-                "floor": stmt.excluded.floor,
-                "total_floors": stmt.excluded.total_floors,
-                "description": stmt.excluded.description,
-                "latitude": stmt.excluded.latitude,
-                "longitude": stmt.excluded.longitude,
-                "last_seen_at": now,
-                "is_active": True,
-            },
-        ).returning(Listing.id)
-        result = await session.execute(stmt)
-        affected_ids = result.scalars().all()
+        driver = session.get_bind().dialect.driver
+        if driver == "asyncpg" and len(rows) >= _COPY_MIN_ROWS:
+            existing_map, affected_ids = await _upsert_listings_via_copy(
+                session, values, now
+            )
+        else:
+            existing_map, affected_ids = await _upsert_listings_via_values(
+                session, rows, values, now
+            )
 
         price_changes: list[PriceChangeUpsert] = []
         for row in rows:
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from decimal import Decimal
+from types import MappingProxyType
 
 from sqlalchemy import DateTime, Index, Integer, Numeric, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
@@ -53,3 +54,9 @@ class RealTrade(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
+
+    # On PostgreSQL the table is partitioned by contract_year and its primary
+    # key is (id, contract_year); see the 20261016_partition migration.
+    # contract_year is deliberately left out of the mapper key: id comes from
+    # one sequence and is unique on its own, so ORM identity stays on id.
+    __mapper_args__ = MappingProxyType({"primary_key": [id]})
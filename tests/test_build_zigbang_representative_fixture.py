@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+fixture_builder = importlib.import_module(
+    "scripts.build_zigbang_representative_fixture"
+)
+
+pytestmark = pytest.mark.anyio
+
+_ETAG = '"zigbang-v1"'
+
+
+def _install_transport(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    transport: httpx.MockTransport,
+) -> None:
+    real_async_client = httpx.AsyncClient
+
+    def client_with_transport(**kwargs: Any) -> httpx.AsyncClient:
+        return real_async_client(transport=transport, **kwargs)
+
+    monkeypatch.setattr(fixture_builder, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(fixture_builder.httpx, "AsyncClient", client_with_transport)
+
+
+async def test_fetch_all_items_revalidates_cached_responses(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    seen_validators: list[str | None] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        validator = request.headers.get("If-None-Match")
+        seen_validators.append(validator)
+        if validator == _ETAG:
+            return httpx.Response(304, headers={"ETag": _ETAG})
+        return httpx.Response(
+            200,
+            headers={"ETag": _ETAG},
+            json={
+                "code": 200,
+                "message": "ok",
+                "items": [{"id": 8214}, {"id": 1}],
+            },
+        )
+
+    _install_transport(monkeypatch, tmp_path, httpx.MockTransport(handle))
+    wanted = frozenset({8214})
+
+    first = await fixture_builder.fetch_all_items(wanted)
+    second = await fixture_builder.fetch_all_items(wanted)
+
+    request_count = len(fixture_builder.REQUEST_MATRIX)
+    assert seen_validators == [None] * request_count + [_ETAG] * request_count
+    assert len(list(tmp_path.iterdir())) == request_count
+    assert second == first
+    candidate_items, request_rows, total_items, unique_ids = second
+    assert candidate_items == [{"id": 8214}] * request_count
+    assert total_items == 2 * request_count
+    assert unique_ids == {8214, 1}
+    assert {row["code"] for row in request_rows} == {200}
+
+
+async def test_fetch_all_items_skips_cache_without_validators(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    def handle(request: httpx.Request) -> httpx.Response:
+        assert "If-None-Match" not in request.headers
+        return httpx.Response(200, json={"code": 200, "items": [{"id": 8214}]})
+
+    _install_transport(monkeypatch, tmp_path, httpx.MockTransport(handle))
+
+    candidate_items, _, total_items, _ = await fixture_builder.fetch_all_items(
+        frozenset({8214})
+    )
+
+    assert total_items == len(fixture_builder.REQUEST_MATRIX)
+    assert len(candidate_items) == len(fixture_builder.REQUEST_MATRIX)
+    assert list(tmp_path.iterdir()) == []
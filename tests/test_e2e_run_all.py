@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import cast
+
+import pytest
+
+from scripts import e2e_mcp_search_rent_check, e2e_run_all, e2e_zigbang_mcp_tool_suite
+
+
+def _make_args() -> e2e_run_all.CliArgs:
+    return e2e_run_all.CliArgs(seed_source_prefix="zigbang_test_seed", mcp_limit=3)
+
+
+@pytest.mark.anyio
+async def test_run_all_uses_distinct_seed_sources(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    seen_sources: list[str] = []
+
+    async def fake_run(
+        args: e2e_mcp_search_rent_check.CliArgs | e2e_zigbang_mcp_tool_suite.CliArgs,
+    ) -> dict[str, object]:
+        seen_sources.append(args.seed_source)
+        return {"status": "success"}
+
+    monkeypatch.setattr("scripts.e2e_mcp_search_rent_check.run", fake_run)
+    monkeypatch.setattr("scripts.e2e_zigbang_mcp_tool_suite.run", fake_run)
+
+    summary = await e2e_run_all.run_all(_make_args())
+
+    assert summary["status"] == "success"
+    assert "failed_checks" not in summary
+    assert sorted(seen_sources) == [
+        "zigbang_test_seed_search_rent",
+        "zigbang_test_seed_tool_suite",
+    ]
+
+
+@pytest.mark.anyio
+async def test_run_all_reports_failed_and_raising_checks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_failing_run(_args: object) -> dict[str, object]:
+        return {"status": "failure", "failures": ["upsert_count <= 0"]}
+
+    async def fake_raising_run(_args: object) -> dict[str, object]:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("scripts.e2e_mcp_search_rent_check.run", fake_failing_run)
+    monkeypatch.setattr("scripts.e2e_zigbang_mcp_tool_suite.run", fake_raising_run)
+
+    summary = await e2e_run_all.run_all(_make_args())
+
+    assert summary["status"] == "failure"
+    assert summary["failed_checks"] == ["search_rent_check", "tool_suite"]
+    reports = cast(dict[str, dict[str, object]], summary["reports"])
+    assert reports["tool_suite"] == {"status": "failure", "error": "boom"}
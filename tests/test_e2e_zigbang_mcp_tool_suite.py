@@ -164,7 +164,7 @@ def _patch_run_dependencies(
         fake_session_context,
     )
     monkeypatch.setattr(
-        "scripts.e2e_zigbang_mcp_tool_suite._cleanup_seed_source",
+        "scripts.e2e_zigbang_mcp_tool_suite.cleanup_seed_source",
         fake_cleanup_seed_source,
     )
     monkeypatch.setattr(
@@ -340,7 +340,7 @@ async def test_run_raises_before_db_when_required_tools_missing(
         fake_session_context,
     )
     monkeypatch.setattr(
-        "scripts.e2e_zigbang_mcp_tool_suite._cleanup_seed_source",
+        "scripts.e2e_zigbang_mcp_tool_suite.cleanup_seed_source",
         fake_cleanup_seed_source,
     )
     monkeypatch.setattr(
@@ -0,0 +1,133 @@
+"""Tests for the listings upsert paths in the repository layer."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import ClauseElement
+
+from src.db import repositories
+from src.db.repositories import ListingUpsert, upsert_listings
+from src.models.listing import Listing
+
+
+def _listing_rows(count: int) -> list[ListingUpsert]:
+    return [
+        ListingUpsert(
+            source="zigbang",
+            source_id=str(index),
+            property_type="apt",
+            rent_type="jeonse",
+            deposit=10000,
+            monthly_rent=0,
+            address="서울특별시 종로구 청운동",
+            dong="청운동",
+            detail_address=None,
+            area_m2=None,
+            floor=None,
+            total_floors=None,
+            description=None,
+            latitude=None,
+            longitude=None,
+        )
+        for index in range(count)
+    ]
+
+
+def _mock_pg_session(driver: str) -> tuple[AsyncMock, AsyncMock]:
+    """Return a session stub bound to PostgreSQL and its asyncpg connection."""
+
+    result = MagicMock()
+    result.all.return_value = []
+    result.scalars.return_value.all.return_value = [1]
+    session = AsyncMock()
+    session.execute.return_value = result
+    session.get_bind = MagicMock(
+        return_value=SimpleNamespace(
+            dialect=SimpleNamespace(name="postgresql", driver=driver)
+        )
+    )
+
+    driver_connection = AsyncMock()
+    raw_connection = SimpleNamespace(driver_connection=driver_connection)
+    connection = AsyncMock()
+    connection.get_raw_connection.return_value = raw_connection
+    session.connection.return_value = connection
+    return session, driver_connection
+
+
+def _executed_sql(session: AsyncMock) -> list[str]:
+    return [
+        str(call.args[0].compile(dialect=postgresql.dialect()))
+        for call in session.execute.call_args_list
+        if isinstance(call.args[0], ClauseElement)
+    ]
+
+
+@pytest.mark.anyio
+async def test_upsert_listings_uses_copy_for_large_asyncpg_batches() -> None:
+    session, driver_connection = _mock_pg_session("asyncpg")
+    rows = _listing_rows(repositories._COPY_MIN_ROWS)
+
+    await upsert_listings(session, rows)
+
+    copy_call = driver_connection.copy_records_to_table.await_args
+    assert copy_call.args == (repositories._LISTING_STAGE_TABLE,)
+    assert copy_call.kwargs["columns"] == list(repositories._LISTING_UPSERT_COLUMNS)
+    assert len(copy_call.kwargs["records"]) == len(rows)
+    assert copy_call.kwargs["records"][0][:2] == ("zigbang", "0")
+
+    create_stage, fetch_existing, merge = _executed_sql(session)
+    assert create_stage.startswith(
+        "CREATE TEMP TABLE listings_stage ON COMMIT DROP AS SELECT source, source_id,"
+    )
+    assert "JOIN listings_stage ON" in fetch_existing
+
+    # from_select appends Python-side column defaults, so is_active is
+    # inserted from a bound literal rather than a staged column.
+    insert_columns = merge[merge.index("(") + 1 : merge.index(")")].split(", ")
+    assert insert_columns == [*repositories._LISTING_UPSERT_COLUMNS, "is_active"]
+    assert "FROM listings_stage ON CONFLICT ON CONSTRAINT" in merge
+    assert merge.endswith("RETURNING listings.id")
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_upsert_listings_uses_values_below_copy_threshold() -> None:
+    session, driver_connection = _mock_pg_session("asyncpg")
+
+    await upsert_listings(session, _listing_rows(repositories._COPY_MIN_ROWS - 1))
+
+    driver_connection.copy_records_to_table.assert_not_awaited()
+    session.connection.assert_not_awaited()
+    statements = _executed_sql(session)
+    assert len(statements) == 2
+    assert statements[1].startswith("INSERT INTO listings (")
+    assert "VALUES" in statements[1]
+
+
+@pytest.mark.anyio
+async def test_upsert_listings_uses_values_for_other_postgres_drivers() -> None:
+    session, driver_connection = _mock_pg_session("psycopg")
+
+    await upsert_listings(session, _listing_rows(repositories._COPY_MIN_ROWS))
+
+    driver_connection.copy_records_to_table.assert_not_awaited()
+    assert not any("listings_stage" in sql for sql in _executed_sql(session))
+
+
+@pytest.mark.anyio
+async def test_upsert_listings_via_values_batches_by_bind_param_limit() -> None:
+    session, _ = _mock_pg_session("psycopg")
+    batch_size = repositories._PG_MAX_BIND_PARAMS // len(Listing.__table__.columns)
+    rows = _listing_rows(batch_size + 1)
+
+    await upsert_listings(session, rows)
+
+    inserts = [
+        call.args[0]
+        for call in session.execute.call_args_list
+        if call.args[0].is_insert
+    ]
+    assert [len(stmt._multi_values[0]) for stmt in inserts] == [batch_size, 1]
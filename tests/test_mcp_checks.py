@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from scripts import _mcp_checks
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_extract_mcp_payload_prefers_structured_content() -> None:
+    text_content = SimpleNamespace(text="not json")
+    payload = _mcp_checks.extract_mcp_payload(
+        ([text_content], {"count": 1, "items": []})
+    )
+
+    assert payload == {"count": 1, "items": []}
+
+
+async def test_extract_mcp_payload_falls_back_to_text_content() -> None:
+    text_content = SimpleNamespace(text='{"count": 2, "items": []}')
+    payload = _mcp_checks.extract_mcp_payload(([text_content], None))
+
+    assert payload == {"count": 2, "items": []}
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
-from src.config.region_codes import region_code_to_parts, region_code_to_sigungu_names
+from scripts.generate_region_codes import generate_region_codes_python
+from src.config import region_codes
+from src.config.region_codes import (
+    REGION_CODE_TO_NAME,
+    SIDO_SIGUNGU,
+    region_code_to_parts,
+    region_code_to_sigungu_names,
+    region_codes_to_district_names,
+)
 
 
 pytestmark = pytest.mark.anyio
@@ -41,3 +51,23 @@ async def test_region_code_to_parts_returns_simple_sigungu_alias() -> None:
 
 async def test_region_code_to_parts_returns_none_for_invalid_code() -> None:
     assert region_code_to_parts("99999") is None
+
+
+async def test_region_codes_to_district_names_matches_first_sigungu_alias() -> None:
+    codes = [*REGION_CODE_TO_NAME, "99999"]
+
+    expected = [
+        names[0] for code in codes if (names := region_code_to_sigungu_names(code))
+    ]
+
+    assert region_codes_to_district_names(codes) == expected
+
+
+async def test_generated_module_matches_committed_region_codes() -> None:
+    sido_dict = {
+        province: list(districts) for province, districts in SIDO_SIGUNGU.items()
+    }
+
+    generated = generate_region_codes_python(sido_dict)
+
+    assert generated == Path(region_codes.__file__).read_text(encoding="utf-8")